@@ -3,14 +3,14 @@
 from __future__ import annotations
 
 import logging
-from typing import TYPE_CHECKING
+import uuid
+from datetime import timedelta
 
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import Platform
-from homeassistant.core import HomeAssistant
-from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.const import EVENT_HOMEASSISTANT_CLOSE, Platform
+from homeassistant.core import Event, HomeAssistant
 
-from .api import AnioApiClient, AnioAuth
+from .api import AnioApiClient, AnioAuth, create_session
 from .const import (
     CONF_ACCESS_TOKEN,
     CONF_APP_UUID,
@@ -20,13 +20,10 @@ from .const import (
 )
 from .coordinator import AnioDataUpdateCoordinator
 
-if TYPE_CHECKING:
-    pass
-
 _LOGGER = logging.getLogger(__name__)
 
 # Platforms to set up
-PLATFORMS: list[Platform] = [
+PLATFORMS: tuple[Platform, ...] = (
     Platform.SENSOR,
     Platform.BINARY_SENSOR,
     Platform.DEVICE_TRACKER,
@@ -34,7 +31,7 @@ PLATFORMS: list[Platform] = [
     Platform.NOTIFY,
     Platform.SWITCH,
     Platform.SELECT,
-]
+)
 
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
@@ -49,8 +46,17 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """
     hass.data.setdefault(DOMAIN, {})
 
-    # Get the aiohttp session
-    session = async_get_clientsession(hass)
+    # Create a dedicated aiohttp session, closed again on unload or when
+    # Home Assistant shuts down without unloading the entry
+    session = create_session()
+
+    async def _close_session(_event: Event) -> None:
+        """Close the API session on Home Assistant shutdown."""
+        await session.close()
+
+    entry.async_on_unload(
+        hass.bus.async_listen_once(EVENT_HOMEASSISTANT_CLOSE, _close_session)
+    )
 
     async def _on_token_refresh(access_token: str, refresh_token: str) -> None:
         """Persist refreshed tokens to the config entry."""
@@ -64,12 +70,21 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         )
         _LOGGER.debug("Persisted refreshed tokens to config entry")
 
+    # Persist a generated app UUID so it stays stable across restarts
+    app_uuid = entry.data.get(CONF_APP_UUID)
+    if not app_uuid:
+        app_uuid = str(uuid.uuid4())
+        hass.config_entries.async_update_entry(
+            entry,
+            data={**entry.data, CONF_APP_UUID: app_uuid},
+        )
+
     # Create auth handler with stored tokens
     auth = AnioAuth(
         session=session,
         access_token=entry.data.get(CONF_ACCESS_TOKEN),
         refresh_token=entry.data.get(CONF_REFRESH_TOKEN),
-        app_uuid=entry.data.get(CONF_APP_UUID),
+        app_uuid=app_uuid,
         on_token_refresh=_on_token_refresh,
     )
 
@@ -87,13 +102,18 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     )
 
     # Fetch initial data
-    await coordinator.async_config_entry_first_refresh()
+    try:
+        await coordinator.async_config_entry_first_refresh()
+    except Exception:
+        await session.close()
+        raise
 
     # Store components for platform access
     hass.data[DOMAIN][entry.entry_id] = {
         "coordinator": coordinator,
         "auth": auth,
         "client": client,
+        "session": session,
     }
 
     # Set up platforms
@@ -124,7 +144,8 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
 
     if unload_ok:
-        hass.data[DOMAIN].pop(entry.entry_id)
+        entry_data = hass.data[DOMAIN].pop(entry.entry_id)
+        await entry_data["session"].close()
 
     _LOGGER.info("ANIO integration unloaded")
 
@@ -134,8 +155,22 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
 async def async_update_options(hass: HomeAssistant, entry: ConfigEntry) -> None:
     """Handle options update.
 
+    A scan interval change is applied to the running coordinator in place;
+    anything else falls back to a full reload.
+
     Args:
         hass: Home Assistant instance.
         entry: Config entry.
     """
-    await hass.config_entries.async_reload(entry.entry_id)
+    entry_data = hass.data.get(DOMAIN, {}).get(entry.entry_id)
+    if entry_data is None or set(entry.options) - {"scan_interval"}:
+        await hass.config_entries.async_reload(entry.entry_id)
+        return
+
+    coordinator: AnioDataUpdateCoordinator = entry_data["coordinator"]
+    update_interval = timedelta(
+        seconds=entry.options.get("scan_interval", DEFAULT_SCAN_INTERVAL)
+    )
+    if coordinator.update_interval != update_interval:
+        coordinator.update_interval = update_interval
+        _LOGGER.debug("Scan interval updated to %s", update_interval)
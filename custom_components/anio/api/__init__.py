@@ -7,6 +7,7 @@ from .exceptions import (
     AnioAuthError,
     AnioConnectionError,
     AnioDeviceNotFoundError,
+    AnioInvalidOtpError,
     AnioMessageTooLongError,
     AnioOtpRequiredError,
     AnioRateLimitError,
@@ -26,6 +27,7 @@ from .models import (
     SilenceTime,
     UserInfo,
 )
+from .util import create_session
 
 __all__ = [
     # Auth
@@ -37,6 +39,7 @@ __all__ = [
     "AnioAuthError",
     "AnioConnectionError",
     "AnioDeviceNotFoundError",
+    "AnioInvalidOtpError",
     "AnioMessageTooLongError",
     "AnioOtpRequiredError",
     "AnioRateLimitError",
@@ -54,4 +57,6 @@ __all__ = [
     "LocationInfo",
     "SilenceTime",
     "UserInfo",
+    # Session
+    "create_session",
 ]
@@ -2,18 +2,25 @@
 
 from __future__ import annotations
 
+import asyncio
 import base64
 import json
 import logging
+import time
 import uuid
-from datetime import datetime, timedelta, timezone
 from typing import TYPE_CHECKING
 
 import aiohttp
 
 from ..const import API_URL, CLIENT_ID, TOKEN_REFRESH_BUFFER
-from .exceptions import AnioAuthError, AnioConnectionError, AnioOtpRequiredError
+from .exceptions import (
+    AnioAuthError,
+    AnioConnectionError,
+    AnioInvalidOtpError,
+    AnioOtpRequiredError,
+)
 from .models import AuthTokens
+from .util import json_dumps, json_loads, read_error_text
 
 if TYPE_CHECKING:
     from collections.abc import Callable, Coroutine
@@ -55,11 +62,18 @@ class AnioAuth:
         self._access_token = access_token
         self._refresh_token = refresh_token
         self._app_uuid = app_uuid or str(uuid.uuid4())
-        self._token_expiry: datetime | None = None
+        self._base_headers: dict[str, str] = {
+            "app-uuid": self._app_uuid,
+            "Content-Type": "application/json",
+        }
+        self._request_headers = self._base_headers
+        # POSIX timestamp after which the token must be refreshed
+        self._token_expiry_ts: float | None = None
         self._on_token_refresh = on_token_refresh
+        self._refresh_lock = asyncio.Lock()
 
         if access_token:
-            self._token_expiry = self._parse_jwt_expiry(access_token)
+            self._set_access_token(access_token)
 
     @property
     def access_token(self) -> str | None:
@@ -76,24 +90,68 @@ class AnioAuth:
         """Get the app UUID."""
         return self._app_uuid
 
+    @property
+    def request_headers(self) -> dict[str, str]:
+        """Get the headers for authenticated API requests.
+
+        The dict is rebuilt only when the access token changes and must
+        not be mutated by callers.
+        """
+        return self._request_headers
+
     @property
     def is_token_valid(self) -> bool:
         """Check if the current token is valid."""
-        if not self._access_token or not self._token_expiry:
+        if not self._access_token or self._token_expiry_ts is None:
             return False
 
-        # Consider token invalid if it expires within the buffer period
-        buffer = timedelta(seconds=TOKEN_REFRESH_BUFFER)
-        return datetime.now(timezone.utc) < (self._token_expiry - buffer)
+        return time.time() < self._token_expiry_ts
+
+    def get_cached_valid_token(self, now: float) -> str | None:
+        """Return the access token if it is still valid at ``now``.
+
+        Synchronous fast path for callers that want to avoid awaiting
+        ensure_valid_token when no refresh is needed.
+
+        Args:
+            now: Current POSIX timestamp.
+
+        Returns:
+            The access token, or None if it must be refreshed.
+        """
+        expiry_ts = self._token_expiry_ts
+        if expiry_ts is not None and now < expiry_ts:
+            return self._access_token
+        return None
 
-    def _parse_jwt_expiry(self, token: str) -> datetime | None:
+    def _set_access_token(self, token: str | None) -> None:
+        """Store a new access token and its refresh deadline.
+
+        The refresh buffer is folded into the stored timestamp so that
+        validity checks are a single float comparison.
+
+        Args:
+            token: The new access token.
+        """
+        self._access_token = token
+        self._request_headers = (
+            {"Authorization": f"Bearer {token}", **self._base_headers}
+            if token
+            else self._base_headers
+        )
+        expiry = self._parse_jwt_expiry(token) if token else None
+        self._token_expiry_ts = (
+            expiry - TOKEN_REFRESH_BUFFER if expiry is not None else None
+        )
+
+    def _parse_jwt_expiry(self, token: str) -> float | None:
         """Parse the expiry time from a JWT token.
 
         Args:
             token: The JWT token.
 
         Returns:
-            The expiry datetime or None if parsing fails.
+            The expiry as a POSIX timestamp or None if parsing fails.
         """
         try:
             # JWT format: header.payload.signature
@@ -111,8 +169,8 @@ class AnioAuth:
             data = json.loads(decoded)
 
             if "exp" in data:
-                return datetime.fromtimestamp(data["exp"], tz=timezone.utc)
-        except (ValueError, KeyError, json.JSONDecodeError) as err:
+                return float(data["exp"])
+        except (ValueError, KeyError, TypeError, json.JSONDecodeError) as err:
             _LOGGER.debug("Failed to parse JWT expiry: %s", err)
 
         return None
@@ -129,16 +187,13 @@ class AnioAuth:
         Raises:
             AnioAuthError: If authentication fails.
             AnioOtpRequiredError: If OTP code is required.
+            AnioInvalidOtpError: If the submitted OTP code was rejected.
             AnioConnectionError: If connection fails.
         """
         if not self._email or not self._password:
             raise AnioAuthError("Email and password are required for login")
 
-        headers = {
-            "client-id": CLIENT_ID,
-            "app-uuid": self._app_uuid,
-            "Content-Type": "application/json",
-        }
+        headers = {"client-id": CLIENT_ID, **self._base_headers}
 
         payload: dict[str, str] = {
             "email": self._email,
@@ -152,30 +207,35 @@ class AnioAuth:
             async with self._session.post(
                 f"{API_URL}/v1/auth/login",
                 headers=headers,
-                json=payload,
+                data=json_dumps(payload),
             ) as response:
                 if response.status == 401:
                     raise AnioAuthError("Invalid email or password")
 
                 if response.status != 200:
-                    text = await response.text()
+                    text = await read_error_text(response)
+                    # Credentials are rejected with 401, so anything else
+                    # after submitting a code means the code was refused
+                    if otp_code:
+                        raise AnioInvalidOtpError(f"OTP code rejected: {text}")
                     raise AnioAuthError(f"Login failed: {text}")
 
-                data = await response.json()
+                data = await response.json(loads=json_loads)
                 tokens = AuthTokens.model_validate(data)
 
                 if tokens.is_otp_required and not otp_code:
                     raise AnioOtpRequiredError()
 
-                self._access_token = tokens.access_token
+                self._set_access_token(tokens.access_token)
                 self._refresh_token = tokens.refresh_token
-                self._token_expiry = self._parse_jwt_expiry(tokens.access_token)
 
-                _LOGGER.debug("Login successful, token expires at %s", self._token_expiry)
+                _LOGGER.debug(
+                    "Login successful, token refresh due at %s", self._token_expiry_ts
+                )
                 return tokens
 
-        except aiohttp.ClientError as err:
-            raise AnioConnectionError(f"Connection failed: {err}") from err
+        except (aiohttp.ClientError, TimeoutError) as err:
+            raise AnioConnectionError(f"Connection failed: {err!r}") from err
 
     async def refresh(self) -> str:
         """Refresh the access token.
@@ -205,12 +265,11 @@ class AnioAuth:
                     raise AnioAuthError("Refresh token expired")
 
                 if response.status != 200:
-                    text = await response.text()
+                    text = await read_error_text(response)
                     raise AnioAuthError(f"Token refresh failed: {text}")
 
-                data = await response.json()
-                self._access_token = data.get("accessToken")
-                self._token_expiry = self._parse_jwt_expiry(self._access_token or "")
+                data = await response.json(loads=json_loads)
+                self._set_access_token(data.get("accessToken"))
 
                 # Capture rotated refresh token if provided
                 new_refresh = data.get("refreshToken")
@@ -218,7 +277,7 @@ class AnioAuth:
                     self._refresh_token = new_refresh
 
                 _LOGGER.debug(
-                    "Token refreshed, new expiry at %s", self._token_expiry
+                    "Token refreshed, refresh due at %s", self._token_expiry_ts
                 )
 
                 # Notify listeners about token update
@@ -230,8 +289,8 @@ class AnioAuth:
 
                 return self._access_token or ""
 
-        except aiohttp.ClientError as err:
-            raise AnioConnectionError(f"Connection failed: {err}") from err
+        except (aiohttp.ClientError, TimeoutError) as err:
+            raise AnioConnectionError(f"Connection failed: {err!r}") from err
 
     async def ensure_valid_token(self) -> str:
         """Ensure we have a valid access token, refreshing if necessary.
@@ -245,8 +304,13 @@ class AnioAuth:
         if self.is_token_valid and self._access_token:
             return self._access_token
 
-        _LOGGER.debug("Token expired or expiring soon, refreshing...")
-        return await self.refresh()
+        # Serialize refreshes so concurrent callers share a single request
+        async with self._refresh_lock:
+            if self.is_token_valid and self._access_token:
+                return self._access_token
+
+            _LOGGER.debug("Token expired or expiring soon, refreshing...")
+            return await self.refresh()
 
     async def logout(self) -> None:
         """Logout and invalidate the session.
@@ -257,6 +321,16 @@ class AnioAuth:
         if not self._access_token:
             return
 
+        # An expired token would only earn a 401, so skip the round trip
+        if (
+            self._token_expiry_ts is not None
+            and time.time() >= self._token_expiry_ts + TOKEN_REFRESH_BUFFER
+        ):
+            _LOGGER.debug("Access token already expired, skipping logout request")
+            self._set_access_token(None)
+            self._refresh_token = None
+            return
+
         headers = {
             "Authorization": f"Bearer {self._access_token}",
         }
@@ -269,10 +343,9 @@ class AnioAuth:
                 if response.status == 200:
                     _LOGGER.debug("Logout successful")
 
-        except aiohttp.ClientError as err:
-            _LOGGER.warning("Logout failed: %s", err)
+        except (aiohttp.ClientError, TimeoutError) as err:
+            _LOGGER.warning("Logout failed: %r", err)
 
         finally:
-            self._access_token = None
+            self._set_access_token(None)
             self._refresh_token = None
-            self._token_expiry = None
@@ -4,11 +4,16 @@ from __future__ import annotations
 
 import asyncio
 import logging
-from typing import TYPE_CHECKING
+import time
+from collections.abc import Mapping
+from typing import TYPE_CHECKING, Any, Literal, TypeVar, overload
 
 import aiohttp
+from pydantic import BaseModel, TypeAdapter, ValidationError
 
 from ..const import (
+    API_CONNECT_TIMEOUT,
+    API_POLL_TIMEOUT,
     API_URL,
     RATE_LIMIT_BACKOFF_BASE,
     RATE_LIMIT_MAX_RETRIES,
@@ -22,6 +27,7 @@ from .exceptions import (
     AnioMessageTooLongError,
     AnioRateLimitError,
 )
+from .limiter import AdaptiveLimiter
 from .models import (
     ActivityItem,
     AlarmClock,
@@ -29,9 +35,15 @@ from .models import (
     Device,
     DeviceLocation,
     Geofence,
-    LocationInfo,
     SilenceTime,
 )
+from .util import (
+    discard_error_body,
+    json_dumps,
+    json_loads,
+    rate_limit_delay,
+    read_error_text,
+)
 
 if TYPE_CHECKING:
     from aiohttp import ClientSession
@@ -40,6 +52,166 @@ if TYPE_CHECKING:
 
 _LOGGER = logging.getLogger(__name__)
 
+_ModelT = TypeVar("_ModelT", bound=BaseModel)
+_T = TypeVar("_T")
+
+# Parse and validate whole list payloads from raw bytes in pydantic-core
+_DEVICE_LIST_ADAPTER = TypeAdapter(list[Device])
+_GEOFENCE_LIST_ADAPTER = TypeAdapter(list[Geofence])
+_ACTIVITY_LIST_ADAPTER = TypeAdapter(list[ActivityItem])
+_LOCATION_LIST_ADAPTER = TypeAdapter(list[DeviceLocation])
+_CHAT_LIST_ADAPTER = TypeAdapter(list[ChatMessage])
+_ALARM_LIST_ADAPTER = TypeAdapter(list[AlarmClock])
+_SILENCE_TIME_LIST_ADAPTER = TypeAdapter(list[SilenceTime])
+
+# Shorter budget for the GETs issued on every poll
+_POLL_TIMEOUT = aiohttp.ClientTimeout(
+    total=API_POLL_TIMEOUT, connect=API_CONNECT_TIMEOUT
+)
+
+# Pre-encoded bodies for the usual flower amounts
+_FLOWER_BODIES = {amount: json_dumps({"amount": amount}) for amount in range(10)}
+
+
+def _decode(raw: bytes) -> Any:
+    """Decode a response body that failed model validation.
+
+    Args:
+        raw: Raw response body.
+
+    Returns:
+        The decoded JSON value.
+
+    Raises:
+        AnioApiError: If the body is not valid JSON.
+    """
+    try:
+        return json_loads(raw)
+    except ValueError as err:
+        raise AnioApiError(f"Invalid JSON response: {err}") from err
+
+
+def _validate_list(
+    adapter: TypeAdapter[list[_ModelT]], raw: bytes | None
+) -> list[_ModelT]:
+    """Validate a JSON array body in one pass.
+
+    Args:
+        adapter: Adapter for the list type.
+        raw: Raw response body.
+
+    Returns:
+        The validated items, or an empty list if the body is not an array.
+
+    Raises:
+        ValidationError: If the array contains invalid items.
+        AnioApiError: If the body is not valid JSON.
+    """
+    if not raw:
+        return []
+    try:
+        return adapter.validate_json(raw)
+    except ValidationError:
+        if not isinstance(_decode(raw), list):
+            return []
+        raise
+
+
+def _validate_object(model: type[_ModelT], raw: bytes | None) -> _ModelT | None:
+    """Validate a JSON object body in one pass.
+
+    Args:
+        model: Model for the object.
+        raw: Raw response body.
+
+    Returns:
+        The validated model, or None if the body is not an object.
+
+    Raises:
+        ValidationError: If the object is invalid.
+        AnioApiError: If the body is not valid JSON.
+    """
+    if not raw:
+        return None
+    try:
+        return model.model_validate_json(raw)
+    except ValidationError:
+        if not isinstance(_decode(raw), dict):
+            return None
+        raise
+
+
+def _validate_items(
+    adapter: TypeAdapter[list[_ModelT]],
+    model: type[_ModelT],
+    raw: bytes | None,
+) -> list[_ModelT]:
+    """Validate a JSON array body, skipping items that fail validation.
+
+    pydantic-core reports every failing item in one pass, so the bad indices
+    are taken from that error and the rest of the array is validated again
+    in a single call rather than item by item.
+
+    Args:
+        adapter: Adapter for the list type.
+        model: Model for a single item.
+        raw: Raw response body.
+
+    Returns:
+        The valid items, or an empty list if the body is not an array.
+
+    Raises:
+        AnioApiError: If the body is not valid JSON.
+    """
+    if not raw:
+        return []
+    try:
+        return adapter.validate_json(raw)
+    except ValidationError as err:
+        errors = err.errors()
+
+    data = _decode(raw)
+    if not isinstance(data, list):
+        return []
+
+    bad_indices = set()
+    for error in errors:
+        if error["loc"]:
+            bad_indices.add(error["loc"][0])
+        _LOGGER.debug(
+            "Failed to parse %s at %s: %s", model.__name__, error["loc"], error["msg"]
+        )
+
+    return adapter.validate_python(
+        [item for index, item in enumerate(data) if index not in bad_indices]
+    )
+
+
+def _optional_result(
+    result: _T | BaseException, default: _T, what: str, device_id: str
+) -> _T:
+    """Unwrap the result of an optional per-device request.
+
+    Args:
+        result: The gathered result or the exception it raised.
+        default: Value to use if the request failed.
+        what: Name of the data, for logging.
+        device_id: The device ID, for logging.
+
+    Returns:
+        The result, or the default after an API error.
+
+    Raises:
+        BaseException: The original exception for auth errors and anything
+            that is not an API error.
+    """
+    if not isinstance(result, BaseException):
+        return result
+    if not isinstance(result, AnioApiError) or isinstance(result, AnioAuthError):
+        raise result
+    _LOGGER.warning("Failed to fetch %s for device %s: %s", what, device_id, result)
+    return default
+
 
 class AnioApiClient:
     """Client for the ANIO Cloud API."""
@@ -53,97 +225,189 @@ class AnioApiClient:
         """
         self._session = session
         self._auth = auth
-        self._retry_count = 0
+        # Set when the server reports an exhausted quota; requests wait for it
+        self._throttled_until = 0.0
+        self._limiter = AdaptiveLimiter()
+
+    @overload
+    async def _request(
+        self,
+        method: str,
+        endpoint: str,
+        *,
+        raw: Literal[False] = ...,
+        **kwargs: Any,
+    ) -> dict | list | None: ...
 
+    @overload
     async def _request(
         self,
         method: str,
         endpoint: str,
-        **kwargs: dict,
-    ) -> dict | list | None:
+        *,
+        raw: Literal[True],
+        **kwargs: Any,
+    ) -> bytes: ...
+
+    async def _request(
+        self,
+        method: str,
+        endpoint: str,
+        *,
+        raw: bool = False,
+        **kwargs: Any,
+    ) -> dict | list | bytes | None:
         """Make an authenticated API request.
 
         Args:
             method: HTTP method.
             endpoint: API endpoint.
+            raw: Return the undecoded response body instead of parsed JSON.
             **kwargs: Additional arguments for aiohttp request.
 
         Returns:
-            JSON response data.
+            JSON response data, or the raw body if raw is set.
 
         Raises:
             AnioApiError: If the request fails.
             AnioRateLimitError: If rate limited.
             AnioConnectionError: If connection fails.
         """
-        token = await self._auth.ensure_valid_token()
+        now = time.time()
+        if now < self._throttled_until:
+            await asyncio.sleep(self._throttled_until - now)
 
-        headers = {
-            "Authorization": f"Bearer {token}",
-            "app-uuid": self._auth.app_uuid,
-            "Content-Type": "application/json",
-            **kwargs.pop("headers", {}),
-        }
+        if self._auth.get_cached_valid_token(time.time()) is None:
+            await self._auth.ensure_valid_token()
+
+        headers = self._auth.request_headers
+        if extra_headers := kwargs.pop("headers", None):
+            headers = {**headers, **extra_headers}
+
+        # Pre-encode once; the bytes are reused across rate-limit retries
+        if (payload := kwargs.pop("json", None)) is not None:
+            kwargs["data"] = json_dumps(payload)
 
         url = f"{API_URL}{endpoint}"
 
-        try:
-            async with self._session.request(
-                method,
-                url,
-                headers=headers,
-                **kwargs,
-            ) as response:
-                if response.status == 429:
-                    retry_after = response.headers.get("Retry-After")
-                    await self._handle_rate_limit(retry_after)
-                    # Retry the request
-                    return await self._request(method, endpoint, **kwargs)
+        for attempt in range(1, RATE_LIMIT_MAX_RETRIES + 2):
+            async with self._limiter:
+                started = time.monotonic()
+                try:
+                    async with self._session.request(
+                        method,
+                        url,
+                        headers=headers,
+                        **kwargs,
+                    ) as response:
+                        self._limiter.notify(
+                            response.status != 429 and response.status < 500,
+                            time.monotonic() - started,
+                        )
+                        if response.status != 429:
+                            if response.headers.get("X-RateLimit-Remaining") == "0":
+                                self._throttle(response.headers)
+                            return await self._handle_response(response, raw)
+
+                        retry_after = rate_limit_delay(response.headers, time.time())
+                        await discard_error_body(response)
+
+                except (aiohttp.ClientError, TimeoutError) as err:
+                    self._limiter.notify(False)
+                    raise AnioConnectionError(f"Connection failed: {err!r}") from err
+
+            if attempt > RATE_LIMIT_MAX_RETRIES:
+                break
+
+            # Back off outside the response context so the connection is released
+            await self._handle_rate_limit(retry_after, attempt)
+
+        raise AnioRateLimitError("Max retries exceeded")
+
+    @overload
+    async def _handle_response(
+        self, response: aiohttp.ClientResponse, raw: Literal[False] = ...
+    ) -> dict | list | None: ...
+
+    @overload
+    async def _handle_response(
+        self, response: aiohttp.ClientResponse, raw: Literal[True]
+    ) -> bytes: ...
+
+    @overload
+    async def _handle_response(
+        self, response: aiohttp.ClientResponse, raw: bool
+    ) -> dict | list | bytes | None: ...
+
+    async def _handle_response(
+        self, response: aiohttp.ClientResponse, raw: bool = False
+    ) -> dict | list | bytes | None:
+        """Map a non-rate-limited response to its JSON payload.
 
-                if response.status == 401:
-                    raise AnioAuthError("Access token rejected by server")
+        Args:
+            response: The aiohttp response.
+            raw: Return the undecoded body instead of parsed JSON.
 
-                if response.status == 404:
-                    raise AnioDeviceNotFoundError("unknown")
+        Returns:
+            The raw body if raw is set, otherwise JSON response data or None
+            for 204 responses.
 
-                if response.status >= 400:
-                    text = await response.text()
-                    raise AnioApiError(f"API error: {text}", response.status)
+        Raises:
+            AnioAuthError: If the access token was rejected.
+            AnioDeviceNotFoundError: If the resource was not found.
+            AnioApiError: If the request failed.
+        """
+        if response.status == 401:
+            await discard_error_body(response)
+            raise AnioAuthError("Access token rejected by server")
 
-                self._retry_count = 0  # Reset on success
+        if response.status == 404:
+            await discard_error_body(response)
+            raise AnioDeviceNotFoundError("unknown")
 
-                if response.status == 204:
-                    return None
+        if response.status >= 400:
+            text = await read_error_text(response)
+            raise AnioApiError(f"API error: {text}", response.status)
 
-                return await response.json()
+        if raw:
+            return await response.read()
 
-        except aiohttp.ClientError as err:
-            raise AnioConnectionError(f"Connection failed: {err}") from err
+        if response.status == 204:
+            return None
 
-    async def _handle_rate_limit(self, retry_after: str | None) -> None:
-        """Handle rate limiting with exponential backoff.
+        data: dict | list = await response.json(loads=json_loads, content_type=None)
+        return data
 
-        Args:
-            retry_after: Retry-After header value.
+    def _throttle(self, headers: Mapping[str, str]) -> None:
+        """Hold back further requests until the reported quota window resets.
 
-        Raises:
-            AnioRateLimitError: If max retries exceeded.
+        Args:
+            headers: Headers of a response that used up the quota.
         """
-        self._retry_count += 1
+        delay = rate_limit_delay(headers, time.time())
+        if delay:
+            self._throttled_until = time.time() + delay
+            _LOGGER.debug("Rate limit quota exhausted, pausing for %.1fs", delay)
 
-        if self._retry_count > RATE_LIMIT_MAX_RETRIES:
-            self._retry_count = 0
-            raise AnioRateLimitError("Max retries exceeded")
+    async def _handle_rate_limit(self, retry_after: float | None, attempt: int) -> None:
+        """Handle rate limiting with exponential backoff.
 
-        if retry_after:
-            wait_time = int(retry_after)
+        Args:
+            retry_after: Server-requested delay in seconds, if any.
+            attempt: The 1-based number of the rate-limited attempt.
+        """
+        if retry_after is not None:
+            wait_time = retry_after
         else:
-            wait_time = RATE_LIMIT_BACKOFF_BASE**self._retry_count
+            wait_time = RATE_LIMIT_BACKOFF_BASE**attempt
+
+        # The quota is shared, so hold back other requests for the same window
+        self._throttled_until = max(self._throttled_until, time.time() + wait_time)
 
         _LOGGER.warning(
-            "Rate limited, waiting %d seconds (attempt %d/%d)",
+            "Rate limited, waiting %.1f seconds (attempt %d/%d)",
             wait_time,
-            self._retry_count,
+            attempt,
             RATE_LIMIT_MAX_RETRIES,
         )
         await asyncio.sleep(wait_time)
@@ -154,10 +418,10 @@ class AnioApiClient:
         Returns:
             List of devices.
         """
-        data = await self._request("GET", "/v1/device/list")
-        if not isinstance(data, list):
-            return []
-        return [Device.model_validate(d) for d in data]
+        raw = await self._request(
+            "GET", "/v1/device/list", raw=True, timeout=_POLL_TIMEOUT
+        )
+        return _validate_list(_DEVICE_LIST_ADAPTER, raw)
 
     async def get_device(self, device_id: str) -> Device:
         """Get a specific device.
@@ -172,8 +436,8 @@ class AnioApiClient:
             AnioDeviceNotFoundError: If device not found.
         """
         try:
-            data = await self._request("GET", f"/v1/device/{device_id}")
-            return Device.model_validate(data)
+            raw = await self._request("GET", f"/v1/device/{device_id}", raw=True)
+            return Device.model_validate_json(raw)
         except AnioDeviceNotFoundError:
             raise AnioDeviceNotFoundError(device_id) from None
 
@@ -226,8 +490,10 @@ class AnioApiClient:
         if username:
             payload["username"] = username
 
-        data = await self._request("POST", "/v1/chat/message/text", json=payload)
-        return ChatMessage.model_validate(data)
+        raw = await self._request(
+            "POST", "/v1/chat/message/text", raw=True, json=payload
+        )
+        return ChatMessage.model_validate_json(raw)
 
     async def send_emoji_message(
         self,
@@ -250,7 +516,8 @@ class AnioApiClient:
         """
         if emoji_code not in VALID_EMOJI_CODES:
             raise AnioApiError(
-                f"Invalid emoji code: {emoji_code}. Valid codes: {VALID_EMOJI_CODES}"
+                f"Invalid emoji code: {emoji_code}. "
+                f"Valid codes: {', '.join(sorted(VALID_EMOJI_CODES))}"
             )
 
         payload: dict[str, str] = {
@@ -260,8 +527,10 @@ class AnioApiClient:
         if username:
             payload["username"] = username
 
-        data = await self._request("POST", "/v1/chat/message/emoji", json=payload)
-        return ChatMessage.model_validate(data)
+        raw = await self._request(
+            "POST", "/v1/chat/message/emoji", raw=True, json=payload
+        )
+        return ChatMessage.model_validate_json(raw)
 
     async def get_activity(self) -> list[ActivityItem]:
         """Get activity feed including messages.
@@ -269,18 +538,8 @@ class AnioApiClient:
         Returns:
             List of activity items.
         """
-        data = await self._request("GET", "/v1/activity")
-        if not isinstance(data, list):
-            return []
-
-        result = []
-        for item in data:
-            try:
-                result.append(ActivityItem.model_validate(item))
-            except Exception as err:  # noqa: BLE001
-                _LOGGER.debug("Failed to parse activity item: %s", err)
-
-        return result
+        raw = await self._request("GET", "/v1/activity", raw=True)
+        return _validate_items(_ACTIVITY_LIST_ADAPTER, ActivityItem, raw)
 
     async def get_geofences(self) -> list[Geofence]:
         """Get all geofences.
@@ -289,10 +548,8 @@ class AnioApiClient:
             List of geofences.
         """
         try:
-            data = await self._request("GET", "/v1/geofence")
-            if not isinstance(data, list):
-                return []
-            return [Geofence.model_validate(g) for g in data]
+            raw = await self._request("GET", "/v1/geofence", raw=True)
+            return _validate_list(_GEOFENCE_LIST_ADAPTER, raw)
         except AnioDeviceNotFoundError:
             # 404 means no geofences exist, which is valid
             _LOGGER.debug("No geofences found (404 response)")
@@ -308,10 +565,8 @@ class AnioApiClient:
             List of location entries, empty on 404.
         """
         try:
-            data = await self._request("GET", f"/v1/location/{device_id}")
-            if not isinstance(data, list):
-                return []
-            return [DeviceLocation.model_validate(loc) for loc in data]
+            raw = await self._request("GET", f"/v1/location/{device_id}", raw=True)
+            return _validate_list(_LOCATION_LIST_ADAPTER, raw)
         except AnioDeviceNotFoundError:
             _LOGGER.debug("No location data for device %s (404)", device_id)
             return []
@@ -326,10 +581,13 @@ class AnioApiClient:
             The last location entry, or None if unavailable.
         """
         try:
-            data = await self._request("GET", f"/v1/location/{device_id}/last")
-            if not isinstance(data, dict):
-                return None
-            return DeviceLocation.model_validate(data)
+            raw = await self._request(
+                "GET",
+                f"/v1/location/{device_id}/last",
+                raw=True,
+                timeout=_POLL_TIMEOUT,
+            )
+            return _validate_object(DeviceLocation, raw)
         except AnioDeviceNotFoundError:
             _LOGGER.debug("No last location for device %s (404)", device_id)
             return None
@@ -341,9 +599,8 @@ class AnioApiClient:
             device_id: The device ID.
             amount: Number of flowers to send (0-99).
         """
-        await self._request(
-            "POST", f"/v1/device/{device_id}/flower", json={"amount": amount}
-        )
+        body = _FLOWER_BODIES.get(amount) or json_dumps({"amount": amount})
+        await self._request("POST", f"/v1/device/{device_id}/flower", data=body)
         _LOGGER.debug("Flower sent to device %s", device_id)
 
     async def get_chat_history(self, device_id: str) -> list[ChatMessage]:
@@ -356,17 +613,8 @@ class AnioApiClient:
             List of chat messages, empty on 404.
         """
         try:
-            data = await self._request("GET", f"/v1/chat/{device_id}")
-            if not isinstance(data, list):
-                return []
-
-            result = []
-            for msg in data:
-                try:
-                    result.append(ChatMessage.model_validate(msg))
-                except Exception as err:  # noqa: BLE001
-                    _LOGGER.debug("Failed to parse chat message: %s", err)
-            return result
+            raw = await self._request("GET", f"/v1/chat/{device_id}", raw=True)
+            return _validate_items(_CHAT_LIST_ADAPTER, ChatMessage, raw)
         except AnioDeviceNotFoundError:
             _LOGGER.debug("No chat history for device %s (404)", device_id)
             return []
@@ -381,17 +629,10 @@ class AnioApiClient:
             List of alarm clocks, empty on error.
         """
         try:
-            data = await self._request("GET", f"/v1/alarm-clock/{device_id}")
-            if not isinstance(data, list):
-                return []
-
-            result = []
-            for item in data:
-                try:
-                    result.append(AlarmClock.model_validate(item))
-                except Exception as err:  # noqa: BLE001
-                    _LOGGER.debug("Failed to parse alarm clock: %s", err)
-            return result
+            raw = await self._request(
+                "GET", f"/v1/alarm-clock/{device_id}", raw=True
+            )
+            return _validate_items(_ALARM_LIST_ADAPTER, AlarmClock, raw)
         except AnioDeviceNotFoundError:
             _LOGGER.debug("No alarms for device %s (404)", device_id)
             return []
@@ -417,10 +658,8 @@ class AnioApiClient:
             "time": time,
             "days": days,
         }
-        data = await self._request("POST", "/v1/alarm-clock", json=payload)
-        if isinstance(data, dict):
-            return AlarmClock.model_validate(data)
-        return None
+        raw = await self._request("POST", "/v1/alarm-clock", raw=True, json=payload)
+        return _validate_object(AlarmClock, raw)
 
     async def delete_alarm(self, alarm_id: str) -> None:
         """Delete an alarm clock.
@@ -440,17 +679,10 @@ class AnioApiClient:
             List of silence times, empty on error.
         """
         try:
-            data = await self._request("GET", f"/v1/silence-time/{device_id}")
-            if not isinstance(data, list):
-                return []
-
-            result = []
-            for item in data:
-                try:
-                    result.append(SilenceTime.model_validate(item))
-                except Exception as err:  # noqa: BLE001
-                    _LOGGER.debug("Failed to parse silence time: %s", err)
-            return result
+            raw = await self._request(
+                "GET", f"/v1/silence-time/{device_id}", raw=True
+            )
+            return _validate_items(_SILENCE_TIME_LIST_ADAPTER, SilenceTime, raw)
         except AnioDeviceNotFoundError:
             _LOGGER.debug("No silence times for device %s (404)", device_id)
             return []
@@ -493,6 +725,59 @@ class AnioApiClient:
             _LOGGER.debug("No tracking mode for device %s", device_id)
             return None
 
+    async def fetch_device_bundle(
+        self, device_id: str
+    ) -> tuple[
+        DeviceLocation | None,
+        list[ChatMessage],
+        list[AlarmClock],
+        list[SilenceTime],
+        str | None,
+    ]:
+        """Fetch everything polled per device concurrently.
+
+        The requests are independent, so they run together over the pooled
+        connections instead of one round trip after another. A failed chat,
+        alarm, silence time or tracking mode request falls back to an empty
+        value instead of failing the others.
+
+        Args:
+            device_id: The device ID.
+
+        Returns:
+            Last location, chat history, alarms, silence times and tracking mode.
+
+        Raises:
+            AnioApiError: If the last location request failed.
+            AnioAuthError: If any request was rejected as unauthorized.
+        """
+        (
+            location,
+            chat_messages,
+            alarms,
+            silence_times,
+            tracking_mode,
+        ) = await asyncio.gather(
+            self.get_last_location(device_id),
+            self.get_chat_history(device_id),
+            self.get_alarms(device_id),
+            self.get_silence_times(device_id),
+            self.get_tracking_mode(device_id),
+            return_exceptions=True,
+        )
+
+        # Battery, signal and online state all come from the last location
+        if isinstance(location, BaseException):
+            raise location
+
+        return (
+            location,
+            _optional_result(chat_messages, [], "chat history", device_id),
+            _optional_result(alarms, [], "alarms", device_id),
+            _optional_result(silence_times, [], "silence times", device_id),
+            _optional_result(tracking_mode, None, "tracking mode", device_id),
+        )
+
     async def update_device_settings(
         self, device_id: str, **kwargs: str | int | bool
     ) -> None:
@@ -42,6 +42,18 @@ class AnioOtpRequiredError(AnioAuthError):
         super().__init__(message)
 
 
+class AnioInvalidOtpError(AnioAuthError):
+    """Exception when a submitted OTP/2FA code is rejected."""
+
+    def __init__(self, message: str = "Invalid OTP code") -> None:
+        """Initialize the exception.
+
+        Args:
+            message: Error message.
+        """
+        super().__init__(message)
+
+
 class AnioRateLimitError(AnioApiError):
     """Exception for rate limiting (429 responses)."""
 
@@ -0,0 +1,81 @@
+"""Adaptive concurrency limiting for the ANIO API client."""
+
+from __future__ import annotations
+
+import asyncio
+import statistics
+from collections import deque
+from types import TracebackType
+
+from ..const import API_CONNECTION_LIMIT, API_INITIAL_CONCURRENCY
+
+# Number of recent successful round trips used for the latency target
+_LATENCY_WINDOW = 50
+
+
+class AdaptiveLimiter:
+    """AIMD limit on the number of requests in flight.
+
+    The limit grows by roughly one per window of fast, successful round
+    trips and halves on rate limiting, server errors or connection failures,
+    so concurrent polling settles at what the server actually admits.
+    """
+
+    def __init__(
+        self,
+        initial: int = API_INITIAL_CONCURRENCY,
+        minimum: int = 1,
+        maximum: int = API_CONNECTION_LIMIT,
+    ) -> None:
+        """Initialize the limiter.
+
+        Args:
+            initial: Starting concurrency limit.
+            minimum: Lowest the limit may shrink to.
+            maximum: Highest the limit may grow to.
+        """
+        self._limit = float(initial)
+        self._minimum = minimum
+        self._maximum = maximum
+        self._in_flight = 0
+        self._condition = asyncio.Condition()
+        self._latencies: deque[float] = deque(maxlen=_LATENCY_WINDOW)
+
+    @property
+    def limit(self) -> int:
+        """Get the current concurrency limit."""
+        return max(self._minimum, int(self._limit))
+
+    async def __aenter__(self) -> None:
+        """Wait for a free slot."""
+        async with self._condition:
+            await self._condition.wait_for(lambda: self._in_flight < self.limit)
+            self._in_flight += 1
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        """Free the slot and wake waiters."""
+        async with self._condition:
+            self._in_flight -= 1
+            self._condition.notify_all()
+
+    def notify(self, ok: bool, latency: float = 0.0) -> None:
+        """Adjust the limit after a round trip.
+
+        Args:
+            ok: Whether the server accepted the request.
+            latency: Seconds until the response headers arrived.
+        """
+        if not ok:
+            self._limit = max(self._minimum, self._limit / 2)
+            return
+
+        # Only grow while latency stays at or under the recent median
+        target = statistics.median(self._latencies) if self._latencies else latency
+        self._latencies.append(latency)
+        if latency <= target:
+            self._limit = min(self._maximum, self._limit + 1 / self._limit)
@@ -3,9 +3,16 @@
 from __future__ import annotations
 
 from datetime import datetime
-from typing import Literal
+from typing import Any, Literal
 
-from pydantic import BaseModel, ConfigDict, Field, field_validator
+from pydantic import (
+    BaseModel,
+    ConfigDict,
+    Field,
+    computed_field,
+    field_validator,
+    model_validator,
+)
 
 
 class AuthTokens(BaseModel):
@@ -106,33 +113,19 @@ class Geofence(BaseModel):
 
     id: str
     name: str
-    latitude: float = Field(alias="lat")
-    longitude: float = Field(alias="lng")
+    # Range checks run natively in pydantic-core
+    latitude: float = Field(alias="lat", ge=-90, le=90)
+    longitude: float = Field(alias="lng", ge=-180, le=180)
     radius: int
 
-    @field_validator("latitude")
-    @classmethod
-    def validate_latitude(cls, v: float) -> float:
-        """Validate latitude is between -90 and 90."""
-        if not -90 <= v <= 90:
-            raise ValueError("Latitude must be between -90 and 90")
-        return v
-
-    @field_validator("longitude")
-    @classmethod
-    def validate_longitude(cls, v: float) -> float:
-        """Validate longitude is between -180 and 180."""
-        if not -180 <= v <= 180:
-            raise ValueError("Longitude must be between -180 and 180")
-        return v
-
 
 class DeviceLocation(BaseModel):
     """Location entry from /v1/location/{deviceId}."""
 
     model_config = ConfigDict(populate_by_name=True)
 
-    position: list[float]
+    latitude: float
+    longitude: float
     battery_level: int = Field(alias="batteryLevel")
     signal_strength: int = Field(alias="signalStrength")
     position_determined_by: str = Field(alias="positionDeterminedBy")
@@ -142,15 +135,28 @@ class DeviceLocation(BaseModel):
     direction: int = 0
     device_id: str = Field(alias="deviceId")
 
+    @model_validator(mode="before")
+    @classmethod
+    def split_position(cls, data: Any) -> Any:
+        """Flatten the [lat, lng] position array into scalar fields.
+
+        Anything else is left untouched, so a null or short position shows
+        up as a normal validation error for the missing coordinates.
+        """
+        if isinstance(data, dict):
+            position = data.get("position")
+            if isinstance(position, list | tuple) and len(position) >= 2:
+                data = dict(data)
+                del data["position"]
+                data.setdefault("latitude", position[0])
+                data.setdefault("longitude", position[1])
+        return data
+
+    @computed_field  # type: ignore[prop-decorator]
     @property
-    def latitude(self) -> float:
-        """Get latitude from position array."""
-        return self.position[0]
-
-    @property
-    def longitude(self) -> float:
-        """Get longitude from position array."""
-        return self.position[1]
+    def position(self) -> tuple[float, float]:
+        """Get the position as a (latitude, longitude) pair."""
+        return (self.latitude, self.longitude)
 
 
 class LocationInfo(BaseModel):
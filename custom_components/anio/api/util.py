@@ -0,0 +1,167 @@
+"""Shared helpers for the ANIO API client."""
+
+from __future__ import annotations
+
+import re
+from collections.abc import Mapping
+from email.utils import parsedate_to_datetime
+from typing import Any
+
+import aiohttp
+
+try:
+    from orjson import dumps as json_dumps
+    from orjson import loads as json_loads
+except ImportError:  # pragma: no cover - orjson ships with Home Assistant
+    import json
+    from json import loads as json_loads  # type: ignore[assignment]
+
+    def json_dumps(obj: Any) -> bytes:  # type: ignore[misc]
+        """Encode an object as compact UTF-8 JSON bytes."""
+        return json.dumps(obj, separators=(",", ":")).encode()
+
+from ..const import (
+    API_CONNECT_TIMEOUT,
+    API_CONNECTION_LIMIT,
+    API_DNS_CACHE_TTL,
+    API_KEEPALIVE_TIMEOUT,
+    API_REQUEST_TIMEOUT,
+)
+
+# Error bodies only end up in exception messages, so don't read more than this
+ERROR_BODY_LIMIT = 512
+
+# Error bodies up to this size are drained so the connection can be reused;
+# for anything larger, closing the connection is cheaper than reading on
+ERROR_DRAIN_LIMIT = 64 * 1024
+
+# Reset values above this are epoch timestamps rather than delta seconds
+_EPOCH_THRESHOLD = 1_000_000_000
+
+# "t=" parameter of the IETF draft RateLimit header, e.g. '"api";r=0;t=55'
+_RATELIMIT_RESET_RE = re.compile(r"(?:^|;)\s*t=(\d+)")
+
+
+async def read_error_text(response: aiohttp.ClientResponse) -> str:
+    """Read a bounded prefix of an error response body.
+
+    The rest of the body is drained so the connection can be reused.
+
+    Args:
+        response: The aiohttp response.
+
+    Returns:
+        Up to ERROR_BODY_LIMIT bytes of the body, decoded as UTF-8.
+    """
+    raw = await response.content.read(ERROR_BODY_LIMIT)
+    await discard_error_body(response)
+    return raw.decode("utf-8", errors="replace")
+
+
+async def discard_error_body(response: aiohttp.ClientResponse) -> None:
+    """Consume an error body so its connection can go back to the pool.
+
+    aiohttp closes, rather than reuses, a keep-alive connection whose body
+    was left unread. Error bodies are small, so reading them (up to
+    ERROR_DRAIN_LIMIT bytes) is cheaper than the TCP and TLS handshake for
+    a new connection.
+
+    Args:
+        response: The aiohttp response.
+    """
+    drained = 0
+    while drained < ERROR_DRAIN_LIMIT:
+        chunk = await response.content.read(ERROR_DRAIN_LIMIT - drained)
+        if not chunk:
+            return
+        drained += len(chunk)
+
+
+def _parse_retry_after(value: str, now: float) -> float | None:
+    """Parse a Retry-After value in delta-seconds or HTTP-date form."""
+    if value.isdigit():
+        return float(value)
+    try:
+        return parsedate_to_datetime(value).timestamp() - now
+    except (TypeError, ValueError):
+        return None
+
+
+def _parse_reset(value: str, now: float) -> float | None:
+    """Parse an X-RateLimit-Reset value given as epoch or delta seconds."""
+    try:
+        reset = float(value)
+    except ValueError:
+        return None
+    return reset - now if reset > _EPOCH_THRESHOLD else reset
+
+
+def rate_limit_delay(headers: Mapping[str, str], now: float) -> float | None:
+    """Work out how long the server wants us to wait before the next request.
+
+    Looks at Retry-After (delta-seconds or HTTP-date), X-RateLimit-Reset
+    (epoch or delta seconds) and the draft RateLimit header's ``t``
+    parameter, and picks the earliest of whichever are present.
+
+    Args:
+        headers: Response headers.
+        now: Current POSIX timestamp.
+
+    Returns:
+        Seconds to wait, or None if no header gave a usable value.
+    """
+    delays: list[float] = []
+
+    if (retry_after := headers.get("Retry-After")) and (
+        delay := _parse_retry_after(retry_after.strip(), now)
+    ) is not None:
+        delays.append(delay)
+
+    if (reset := headers.get("X-RateLimit-Reset")) and (
+        delay := _parse_reset(reset.strip(), now)
+    ) is not None:
+        delays.append(delay)
+
+    if (ratelimit := headers.get("RateLimit")) and (
+        match := _RATELIMIT_RESET_RE.search(ratelimit)
+    ):
+        delays.append(float(match.group(1)))
+
+    if not delays:
+        return None
+    return max(min(delays), 0.0)
+
+
+def create_session() -> aiohttp.ClientSession:
+    """Create a dedicated client session for the ANIO API.
+
+    All requests go to a single host, so a small pool with a long keepalive
+    lets consecutive requests reuse the same TLS connection. The session is
+    meant to live for the whole config entry and be closed on unload.
+
+    Returns:
+        A new aiohttp client session.
+    """
+    return aiohttp.ClientSession(
+        connector=aiohttp.TCPConnector(
+            limit_per_host=API_CONNECTION_LIMIT,
+            keepalive_timeout=API_KEEPALIVE_TIMEOUT,
+            ttl_dns_cache=API_DNS_CACHE_TTL,
+        ),
+        # A stalled request must not hold a pool slot indefinitely
+        timeout=aiohttp.ClientTimeout(
+            total=API_REQUEST_TIMEOUT, connect=API_CONNECT_TIMEOUT
+        ),
+    )
+
+
+__all__ = [
+    "ERROR_BODY_LIMIT",
+    "ERROR_DRAIN_LIMIT",
+    "create_session",
+    "discard_error_body",
+    "json_dumps",
+    "json_loads",
+    "rate_limit_delay",
+    "read_error_text",
+]
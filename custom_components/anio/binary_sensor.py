@@ -10,7 +10,7 @@ from homeassistant.components.binary_sensor import (
 )
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import EntityCategory
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
 from .api import Geofence
@@ -29,17 +29,18 @@ async def async_setup_entry(
         "coordinator"
     ]
 
-    entities: list[BinarySensorEntity] = []
-
-    for device_id in coordinator.data:
-        # Add online status sensor for each device
-        entities.append(AnioOnlineSensor(coordinator, device_id))
+    # Online status sensor for each device
+    entities: list[BinarySensorEntity] = [
+        AnioOnlineSensor(coordinator, device_id) for device_id in coordinator.data
+    ]
 
-        # Add geofence sensors for each device/geofence combination
-        for geofence in coordinator.geofences:
-            entities.append(
-                AnioGeofenceSensor(coordinator, device_id, geofence)
-            )
+    # Geofence sensors for each device/geofence combination
+    geofences = coordinator.geofences
+    entities.extend(
+        AnioGeofenceSensor(coordinator, device_id, geofence)
+        for device_id in coordinator.data
+        for geofence in geofences
+    )
 
     async_add_entities(entities)
 
@@ -49,6 +50,7 @@ class AnioOnlineSensor(AnioEntity, BinarySensorEntity):
 
     _attr_device_class = BinarySensorDeviceClass.CONNECTIVITY
     _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _attr_name = "Online"
 
     def __init__(
         self,
@@ -59,18 +61,15 @@ class AnioOnlineSensor(AnioEntity, BinarySensorEntity):
         super().__init__(coordinator, device_id)
         self._attr_unique_id = f"{device_id}_online"
 
-    @property
-    def name(self) -> str:
-        """Return the name of the sensor."""
-        return "Online"
+    @callback
+    def _async_update_attrs(self) -> None:
+        """Update the online status."""
+        device_state = self.device_state
+        self._attr_is_on = device_state.is_online if device_state else None
 
-    @property
-    def is_on(self) -> bool | None:
-        """Return True if the device is online."""
-        device_state = self.coordinator.data.get(self._device_id)
-        if device_state:
-            return device_state.is_online
-        return None
+    def _state_inputs(self) -> tuple[Any, ...]:
+        """Return the online status."""
+        return (self.is_on,)
 
 
 class AnioGeofenceSensor(AnioGeofenceEntity, BinarySensorEntity):
@@ -87,11 +86,14 @@ class AnioGeofenceSensor(AnioGeofenceEntity, BinarySensorEntity):
         """Initialize the geofence sensor."""
         super().__init__(coordinator, device_id, geofence)
         self._attr_unique_id = f"{device_id}_geofence_{geofence.id}"
-
-    @property
-    def name(self) -> str:
-        """Return the name of the sensor."""
-        return f"At {self._geofence.name}"
+        self._attr_name = f"At {geofence.name}"
+        # The geofence is fixed for the entity's lifetime, so build these once
+        self._attr_extra_state_attributes = {
+            "geofence_name": geofence.name,
+            "latitude": geofence.latitude,
+            "longitude": geofence.longitude,
+            "radius_meters": geofence.radius,
+        }
 
     @property
     def is_on(self) -> bool | None:
@@ -99,13 +101,3 @@ class AnioGeofenceSensor(AnioGeofenceEntity, BinarySensorEntity):
         return self.coordinator.is_device_in_geofence(
             self._device_id, self._geofence.id
         )
-
-    @property
-    def extra_state_attributes(self) -> dict[str, Any] | None:
-        """Return additional state attributes."""
-        return {
-            "geofence_name": self._geofence.name,
-            "latitude": self._geofence.latitude,
-            "longitude": self._geofence.longitude,
-            "radius_meters": self._geofence.radius,
-        }
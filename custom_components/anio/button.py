@@ -24,21 +24,15 @@ async def async_setup_entry(
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Set up ANIO button entities from a config entry."""
-    coordinator: AnioDataUpdateCoordinator = hass.data[DOMAIN][entry.entry_id][
-        "coordinator"
+    entry_data = hass.data[DOMAIN][entry.entry_id]
+    coordinator: AnioDataUpdateCoordinator = entry_data["coordinator"]
+    client: AnioApiClient = entry_data["client"]
+
+    entities: list[ButtonEntity] = [
+        button_class(coordinator, client, device_id)
+        for device_id in coordinator.data
+        for button_class in (AnioLocateButton, AnioPowerOffButton, AnioFlowerButton)
     ]
-    client: AnioApiClient = hass.data[DOMAIN][entry.entry_id]["client"]
-
-    entities: list[ButtonEntity] = []
-
-    for device_id in coordinator.data:
-        entities.extend(
-            [
-                AnioLocateButton(coordinator, client, device_id),
-                AnioPowerOffButton(coordinator, client, device_id),
-                AnioFlowerButton(coordinator, client, device_id),
-            ]
-        )
 
     async_add_entities(entities)
 
@@ -46,6 +40,7 @@ async def async_setup_entry(
 class AnioLocateButton(AnioEntity, ButtonEntity):
     """Button entity for triggering ANIO watch location request."""
 
+    _attr_name = "Locate"
     _attr_icon = "mdi:crosshairs-gps"
     _attr_entity_category = EntityCategory.DIAGNOSTIC
 
@@ -66,11 +61,6 @@ class AnioLocateButton(AnioEntity, ButtonEntity):
         self._client = client
         self._attr_unique_id = f"{device_id}_locate"
 
-    @property
-    def name(self) -> str:
-        """Return the name of the button."""
-        return "Locate"
-
     async def async_press(self) -> None:
         """Handle the button press."""
         _LOGGER.info("Requesting location for device %s", self._device_id)
@@ -86,6 +76,7 @@ class AnioLocateButton(AnioEntity, ButtonEntity):
 class AnioPowerOffButton(AnioEntity, ButtonEntity):
     """Button entity for powering off ANIO watch."""
 
+    _attr_name = "Power Off"
     _attr_icon = "mdi:power"
     _attr_entity_category = EntityCategory.CONFIG
     _attr_device_class = ButtonDeviceClass.RESTART
@@ -107,11 +98,6 @@ class AnioPowerOffButton(AnioEntity, ButtonEntity):
         self._client = client
         self._attr_unique_id = f"{device_id}_power_off"
 
-    @property
-    def name(self) -> str:
-        """Return the name of the button."""
-        return "Power Off"
-
     async def async_press(self) -> None:
         """Handle the button press."""
         _LOGGER.warning(
@@ -127,6 +113,7 @@ class AnioPowerOffButton(AnioEntity, ButtonEntity):
 class AnioFlowerButton(AnioEntity, ButtonEntity):
     """Button entity for sending a flower (praise) to the ANIO watch."""
 
+    _attr_name = "Flower"
     _attr_icon = "mdi:flower"
 
     def __init__(
@@ -146,11 +133,6 @@ class AnioFlowerButton(AnioEntity, ButtonEntity):
         self._client = client
         self._attr_unique_id = f"{device_id}_flower"
 
-    @property
-    def name(self) -> str:
-        """Return the name of the button."""
-        return "Flower"
-
     async def async_press(self) -> None:
         """Handle the button press."""
         _LOGGER.debug("Sending flower to device %s", self._device_id)
@@ -5,14 +5,19 @@ from __future__ import annotations
 import logging
 from typing import Any
 
-import aiohttp
 import voluptuous as vol
 from homeassistant.config_entries import ConfigFlow, ConfigFlowResult, OptionsFlow
 from homeassistant.const import CONF_EMAIL, CONF_PASSWORD
 from homeassistant.core import callback
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
 
-from .api import AnioAuth, AnioAuthError, AnioOtpRequiredError
+from .api import (
+    AnioAuth,
+    AnioAuthError,
+    AnioConnectionError,
+    AnioInvalidOtpError,
+    AnioOtpRequiredError,
+)
 from .const import (
     CONF_ACCESS_TOKEN,
     CONF_APP_UUID,
@@ -38,6 +43,18 @@ STEP_OTP_DATA_SCHEMA = vol.Schema(
     }
 )
 
+STEP_REAUTH_DATA_SCHEMA = vol.Schema(
+    {
+        vol.Required(CONF_PASSWORD): str,
+    }
+)
+
+# Shared by every options form; only the default changes per entry
+_SCAN_INTERVAL_VALIDATOR = vol.All(
+    vol.Coerce(int),
+    vol.Range(min=MIN_SCAN_INTERVAL, max=MAX_SCAN_INTERVAL),
+)
+
 
 class AnioConfigFlow(ConfigFlow, domain=DOMAIN):
     """Handle a config flow for ANIO Smartwatch."""
@@ -65,42 +82,17 @@ class AnioConfigFlow(ConfigFlow, domain=DOMAIN):
         errors: dict[str, str] = {}
 
         if user_input is not None:
-            self._email = user_input[CONF_EMAIL]
-            self._password = user_input[CONF_PASSWORD]
+            self._set_credentials(user_input[CONF_EMAIL], user_input[CONF_PASSWORD])
 
             # Check if already configured
-            await self.async_set_unique_id(self._email.lower())
+            await self.async_set_unique_id(user_input[CONF_EMAIL].lower())
             self._abort_if_unique_id_configured()
 
-            try:
-                session = async_get_clientsession(self.hass)
-                self._auth = AnioAuth(
-                    session=session,
-                    email=self._email,
-                    password=self._password,
-                )
-
-                tokens = await self._auth.login()
-
-                if tokens.is_otp_required:
-                    return await self.async_step_2fa()
-
-                return self._create_entry()
-
-            except AnioOtpRequiredError:
+            otp_required, errors = await self._do_login()
+            if otp_required:
                 return await self.async_step_2fa()
-
-            except AnioAuthError as err:
-                _LOGGER.error("Authentication failed: %s", err)
-                errors["base"] = "invalid_auth"
-
-            except aiohttp.ClientError as err:
-                _LOGGER.error("Connection failed: %s", err)
-                errors["base"] = "cannot_connect"
-
-            except Exception:
-                _LOGGER.exception("Unexpected exception")
-                errors["base"] = "unknown"
+            if not errors:
+                return self._create_entry()
 
         return self.async_show_form(
             step_id="user",
@@ -128,22 +120,13 @@ class AnioConfigFlow(ConfigFlow, domain=DOMAIN):
             if not self._auth:
                 return self.async_abort(reason="auth_error")
 
-            try:
-                await self._auth.login(otp_code=otp_code)
+            otp_required, errors = await self._do_login(otp_code)
+            if otp_required:
+                # A blank code, or the server is still waiting for one
+                errors = {"base": "invalid_otp"}
+            elif not errors:
                 return self._create_entry()
 
-            except AnioAuthError as err:
-                _LOGGER.error("2FA authentication failed: %s", err)
-                errors["base"] = "invalid_otp"
-
-            except aiohttp.ClientError as err:
-                _LOGGER.error("Connection failed: %s", err)
-                errors["base"] = "cannot_connect"
-
-            except Exception:
-                _LOGGER.exception("Unexpected exception")
-                errors["base"] = "unknown"
-
         return self.async_show_form(
             step_id="2fa",
             data_schema=STEP_OTP_DATA_SCHEMA,
@@ -151,6 +134,65 @@ class AnioConfigFlow(ConfigFlow, domain=DOMAIN):
             description_placeholders={"email": self._email or ""},
         )
 
+    def _set_credentials(self, email: str | None, password: str) -> None:
+        """Store the submitted credentials.
+
+        The auth handler is kept across form retries and only dropped
+        when the credentials change, so an OTP retry continues with the
+        same handler instead of starting over.
+
+        Args:
+            email: Account email.
+            password: Account password.
+        """
+        if (email, password) != (self._email, self._password):
+            self._auth = None
+        self._email = email
+        self._password = password
+
+    async def _do_login(
+        self,
+        otp_code: str | None = None,
+    ) -> tuple[bool, dict[str, str]]:
+        """Log in with the stored credentials.
+
+        Args:
+            otp_code: One-time password for accounts with 2FA.
+
+        Returns:
+            Whether an OTP code is still required, and the form errors.
+        """
+        if self._auth is None:
+            self._auth = AnioAuth(
+                session=async_get_clientsession(self.hass),
+                email=self._email,
+                password=self._password,
+            )
+
+        try:
+            tokens = await self._auth.login(otp_code=otp_code)
+
+        except AnioOtpRequiredError:
+            return True, {}
+
+        except AnioInvalidOtpError as err:
+            _LOGGER.error("2FA authentication failed: %s", err)
+            return False, {"base": "invalid_otp"}
+
+        except AnioAuthError as err:
+            _LOGGER.error("Authentication failed: %s", err)
+            return False, {"base": "invalid_auth"}
+
+        except AnioConnectionError as err:
+            _LOGGER.error("Connection failed: %s", err)
+            return False, {"base": "cannot_connect"}
+
+        except Exception:
+            _LOGGER.exception("Unexpected exception")
+            return False, {"base": "unknown"}
+
+        return tokens.is_otp_required and not otp_code, {}
+
     def _create_entry(self) -> ConfigFlowResult:
         """Create the config entry.
 
@@ -200,27 +242,19 @@ class AnioConfigFlow(ConfigFlow, domain=DOMAIN):
         errors: dict[str, str] = {}
 
         if user_input is not None:
-            self._password = user_input[CONF_PASSWORD]
-
-            try:
-                session = async_get_clientsession(self.hass)
-                self._auth = AnioAuth(
-                    session=session,
-                    email=self._email,
-                    password=self._password,
-                )
-
-                tokens = await self._auth.login()
+            self._set_credentials(self._email, user_input[CONF_PASSWORD])
 
-                if tokens.is_otp_required:
-                    return await self.async_step_2fa()
+            otp_required, errors = await self._do_login()
+            if otp_required:
+                return await self.async_step_2fa()
 
+            if not errors:
                 # Update the existing entry
                 existing_entry = await self.async_set_unique_id(
                     self._email.lower() if self._email else ""
                 )
 
-                if existing_entry:
+                if existing_entry and self._auth:
                     self.hass.config_entries.async_update_entry(
                         existing_entry,
                         data={
@@ -235,22 +269,9 @@ class AnioConfigFlow(ConfigFlow, domain=DOMAIN):
 
                 return self._create_entry()
 
-            except AnioOtpRequiredError:
-                return await self.async_step_2fa()
-
-            except AnioAuthError:
-                errors["base"] = "invalid_auth"
-
-            except aiohttp.ClientError:
-                errors["base"] = "cannot_connect"
-
-            except Exception:
-                _LOGGER.exception("Unexpected exception")
-                errors["base"] = "unknown"
-
         return self.async_show_form(
             step_id="reauth_confirm",
-            data_schema=vol.Schema({vol.Required(CONF_PASSWORD): str}),
+            data_schema=STEP_REAUTH_DATA_SCHEMA,
             errors=errors,
             description_placeholders={"email": self._email or ""},
         )
@@ -308,10 +329,7 @@ class AnioOptionsFlow(OptionsFlow):
                     vol.Required(
                         "scan_interval",
                         default=current_interval,
-                    ): vol.All(
-                        vol.Coerce(int),
-                        vol.Range(min=MIN_SCAN_INTERVAL, max=MAX_SCAN_INTERVAL),
-                    ),
+                    ): _SCAN_INTERVAL_VALIDATOR,
                 }
             ),
         )
@@ -9,10 +9,23 @@ DOMAIN: Final = "anio"
 API_URL: Final = "https://api.anio.cloud"
 CLIENT_ID: Final = "anio"
 
+# Connection pooling for the dedicated ANIO API session
+API_CONNECTION_LIMIT: Final = 10
+API_KEEPALIVE_TIMEOUT: Final = 75  # Seconds to keep idle connections open
+API_DNS_CACHE_TTL: Final = 300  # Seconds to cache the API host lookup
+API_INITIAL_CONCURRENCY: Final = 4  # Starting point for the adaptive limiter
+
+# Request timeouts in seconds
+API_REQUEST_TIMEOUT: Final = 15
+API_CONNECT_TIMEOUT: Final = 5
+API_POLL_TIMEOUT: Final = 10  # Hot polling GETs
+
 # Polling configuration
 DEFAULT_SCAN_INTERVAL: Final = 300  # 5 minutes in seconds
 MIN_SCAN_INTERVAL: Final = 60  # 1 minute minimum
 MAX_SCAN_INTERVAL: Final = 300  # 5 minutes maximum
+REQUEST_REFRESH_COOLDOWN: Final = 1.0  # Seconds to collect refresh requests
+GEOFENCE_REFRESH_POLLS: Final = 10  # Refetch geofences every N polls
 
 # Token refresh configuration
 TOKEN_REFRESH_BUFFER: Final = 300  # Refresh 5 minutes before expiry
@@ -45,7 +58,7 @@ SENDER_WATCH: Final = "WATCH"
 SENDER_DEVICE: Final = "DEVICE"
 
 # Emoji codes
-VALID_EMOJI_CODES: Final = [f"E{i:02d}" for i in range(1, 13)]  # E01-E12
+VALID_EMOJI_CODES: Final = frozenset(f"E{i:02d}" for i in range(1, 13))  # E01-E12
 
 # Event types
 EVENT_MESSAGE_RECEIVED: Final = f"{DOMAIN}_message_received"
@@ -54,7 +67,7 @@ EVENT_MESSAGE_RECEIVED: Final = f"{DOMAIN}_message_received"
 RING_PROFILES: Final = ["RING_AND_VIBRATE", "VIBRATE_ONLY", "SILENT"]
 
 # Platforms
-PLATFORMS: Final = [
+PLATFORMS: Final = (
     "sensor",
     "binary_sensor",
     "device_tracker",
@@ -62,4 +75,4 @@ PLATFORMS: Final = [
     "notify",
     "switch",
     "select",
-]
+)
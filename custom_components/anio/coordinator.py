@@ -2,22 +2,27 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
 import math
+from collections import OrderedDict
 from datetime import datetime, timedelta, timezone
 from typing import Any
 
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.exceptions import ConfigEntryAuthFailed
+from homeassistant.helpers.debounce import Debouncer
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 
 from .api import (
     AnioApiClient,
+    AnioApiError,
     AnioAuthError,
     AnioConnectionError,
     AnioDeviceState,
     AnioRateLimitError,
+    Device,
     Geofence,
     LocationInfo,
 )
@@ -25,6 +30,8 @@ from .const import (
     DEFAULT_SCAN_INTERVAL,
     DOMAIN,
     EVENT_MESSAGE_RECEIVED,
+    GEOFENCE_REFRESH_POLLS,
+    REQUEST_REFRESH_COOLDOWN,
     SENDER_DEVICE,
     SENDER_WATCH,
 )
@@ -34,6 +41,97 @@ _LOGGER = logging.getLogger(__name__)
 # Consider device offline if last seen more than 10 minutes ago
 ONLINE_THRESHOLD = timedelta(minutes=10)
 
+# Number of recent message IDs remembered to avoid duplicate events
+MAX_SEEN_MESSAGES = 1000
+
+# Senders whose messages count as coming from the watch
+WATCH_SENDERS = frozenset((SENDER_WATCH, SENDER_DEVICE))
+
+# Earth's radius in meters
+EARTH_RADIUS = 6371000
+
+# Up to this radius the flat-earth approximation, scaled by the mean cosine of
+# both latitudes, stays within a few centimeters of the haversine distance
+# (under 1 cm up to 70 degrees of latitude)
+FLAT_EARTH_MAX_RADIUS = 10000
+
+
+def _haversine_distance(
+    lat1: float,
+    lon1: float,
+    cos_lat1: float,
+    lat2: float,
+    lon2: float,
+) -> float:
+    """Great-circle distance between two points given in radians.
+
+    Args:
+        lat1: First latitude.
+        lon1: First longitude.
+        cos_lat1: Cosine of the first latitude, hoisted by callers that
+            compare one point against many.
+        lat2: Second latitude.
+        lon2: Second longitude.
+
+    Returns:
+        Distance in meters.
+    """
+    a = (
+        math.sin((lat2 - lat1) / 2) ** 2
+        + cos_lat1 * math.cos(lat2) * math.sin((lon2 - lon1) / 2) ** 2
+    )
+    return 2 * EARTH_RADIUS * math.atan2(math.sqrt(a), math.sqrt(1 - a))
+
+
+def _is_within_radius(
+    lat: float,
+    lon: float,
+    cos_lat: float,
+    fence_lat: float,
+    fence_lon: float,
+    fence_cos_lat: float,
+    radius: float,
+) -> bool:
+    """Check if a point lies within a radius of a fence center.
+
+    Small fences use an equirectangular projection between the point and the
+    fence center and compare squared distances, which needs no trig per
+    check. Larger fences fall back to the haversine formula.
+
+    Args:
+        lat: Point latitude in radians.
+        lon: Point longitude in radians.
+        cos_lat: Cosine of the point latitude.
+        fence_lat: Fence center latitude in radians.
+        fence_lon: Fence center longitude in radians.
+        fence_cos_lat: Cosine of the fence center latitude.
+        radius: Fence radius in meters.
+
+    Returns:
+        True if the point is inside the fence.
+    """
+    # The distance is never less than the north-south separation, so points
+    # outside the fence's latitude band are rejected without further math
+    dy = EARTH_RADIUS * (lat - fence_lat)
+    if abs(dy) > radius:
+        return False
+
+    if radius > FLAT_EARTH_MAX_RADIUS:
+        distance = _haversine_distance(lat, lon, cos_lat, fence_lat, fence_lon)
+        return distance <= radius
+
+    delta_lon = lon - fence_lon
+    # Take the short way around across the antimeridian
+    if delta_lon > math.pi:
+        delta_lon -= 2 * math.pi
+    elif delta_lon < -math.pi:
+        delta_lon += 2 * math.pi
+
+    # Scale by the mean of both cosines; the fence's alone is off by meters
+    # at high latitudes
+    dx = EARTH_RADIUS * (cos_lat + fence_cos_lat) / 2 * delta_lon
+    return dx * dx + dy * dy <= radius * radius
+
 
 class AnioDataUpdateCoordinator(DataUpdateCoordinator[dict[str, AnioDeviceState]]):
     """Coordinator for fetching ANIO device data."""
@@ -58,11 +156,26 @@ class AnioDataUpdateCoordinator(DataUpdateCoordinator[dict[str, AnioDeviceState]
             _LOGGER,
             name=DOMAIN,
             update_interval=timedelta(seconds=scan_interval),
+            # A refresh polls every endpoint for every device, so collapse
+            # bursts of button presses and setting changes into one trailing
+            # refresh instead of refreshing on the first request
+            request_refresh_debouncer=Debouncer(
+                hass,
+                _LOGGER,
+                cooldown=REQUEST_REFRESH_COOLDOWN,
+                immediate=False,
+            ),
         )
         self.client = client
         self._last_activity_check: datetime | None = None
-        self._seen_message_ids: set[str] = set()
+        # Recently seen message IDs, oldest first
+        self._seen_messages: OrderedDict[str, None] = OrderedDict()
         self._geofences: list[Geofence] = []
+        # Geofences only change when edited in the app, so they are not
+        # refetched on every poll
+        self._geofence_polls_left = 0
+        # (device_id, geofence_id) -> inside, rebuilt on every update
+        self._geofence_presence: dict[tuple[str, str], bool] = {}
 
     @property
     def geofences(self) -> list[Geofence]:
@@ -80,72 +193,32 @@ class AnioDataUpdateCoordinator(DataUpdateCoordinator[dict[str, AnioDeviceState]
             UpdateFailed: If data fetch fails.
         """
         try:
-            # Fetch devices
-            devices = await self.client.get_devices()
-
-            # Fetch geofences (cached, refreshed each poll)
-            self._geofences = await self.client.get_geofences()
-
-            # Fetch activity for messages
-            activity = await self.client.get_activity()
-            self._last_activity_check = datetime.now(timezone.utc)
+            # Devices, geofences and activity are independent endpoints
+            devices, self._geofences, activity = await asyncio.gather(
+                self.client.get_devices(),
+                self._async_get_geofences(),
+                self.client.get_activity(),
+            )
+            now = datetime.now(timezone.utc)
+            self._last_activity_check = now
 
             # Process incoming messages and fire events
             await self._process_messages(activity)
 
             # Build state for each device
-            result: dict[str, AnioDeviceState] = {}
+            states = await asyncio.gather(
+                *(self._async_fetch_device_state(device, now) for device in devices),
+                return_exceptions=True,
+            )
 
-            for device in devices:
-                # Fetch last location from /v1/location/{deviceId}/last
-                latest = await self.client.get_last_location(device.id)
-
-                location: LocationInfo | None = None
-                last_seen: datetime | None = None
-                battery_level = 0
-                signal_strength = 0
-
-                if latest:
-                    location = LocationInfo(
-                        lat=latest.latitude,
-                        lng=latest.longitude,
-                        accuracy=0,
-                        timestamp=latest.date,
-                    )
-                    last_seen = latest.last_response
-                    battery_level = latest.battery_level
-                    signal_strength = latest.signal_strength
-
-                # Fetch chat history and find last WATCH/DEVICE message
-                last_message = None
-                chat_messages = await self.client.get_chat_history(device.id)
-                for msg in reversed(chat_messages):
-                    if msg.sender in (SENDER_WATCH, SENDER_DEVICE):
-                        last_message = msg
-                        break
-
-                # Fetch alarms, silence times, and tracking mode
-                alarms = await self.client.get_alarms(device.id)
-                silence_times = await self.client.get_silence_times(device.id)
-                tracking_mode = await self.client.get_tracking_mode(device.id)
-
-                is_online = self._calculate_online_status(last_seen)
-
-                state = AnioDeviceState(
-                    device=device,
-                    location=location,
-                    geofences=self._get_device_geofences(device.id, location),
-                    last_seen=last_seen,
-                    is_online=is_online,
-                    battery_level_value=battery_level,
-                    signal_strength=signal_strength,
-                    last_message=last_message,
-                    alarms=alarms,
-                    silence_times=silence_times,
-                    tracking_mode=tracking_mode,
-                )
+            result: dict[str, AnioDeviceState] = {}
+            for device, state in zip(devices, states, strict=True):
+                if isinstance(state, BaseException):
+                    raise state
                 result[device.id] = state
 
+            self._geofence_presence = self._compute_geofence_presence(result)
+
             _LOGGER.debug(
                 "Updated %d devices, %d geofences",
                 len(result),
@@ -159,97 +232,139 @@ class AnioDataUpdateCoordinator(DataUpdateCoordinator[dict[str, AnioDeviceState]
             raise UpdateFailed(f"Rate limited: {err}") from err
         except AnioConnectionError as err:
             raise UpdateFailed(f"Connection error: {err}") from err
+        except AnioApiError as err:
+            raise UpdateFailed(f"API error: {err}") from err
 
-    def _calculate_online_status(self, last_seen: datetime | None) -> bool:
-        """Calculate if a device is online based on last seen time.
-
-        Args:
-            last_seen: Last seen datetime.
+    async def _async_get_geofences(self) -> list[Geofence]:
+        """Get geofences, refetching them every few polls.
 
         Returns:
-            True if device is considered online.
+            The current geofences.
         """
-        if last_seen is None:
-            return False
+        if self._geofence_polls_left > 0:
+            self._geofence_polls_left -= 1
+            return self._geofences
 
-        now = datetime.now(timezone.utc)
-        return (now - last_seen) < ONLINE_THRESHOLD
+        geofences = await self.client.get_geofences()
+        self._geofence_polls_left = GEOFENCE_REFRESH_POLLS - 1
+        return geofences
 
-    def _get_device_geofences(
+    async def _async_fetch_device_state(
         self,
-        device_id: str,
-        location: LocationInfo | None,
-    ) -> list[Geofence]:
-        """Get geofences with is_device_inside calculated.
+        device: Device,
+        now: datetime,
+    ) -> AnioDeviceState:
+        """Fetch all per-device endpoints concurrently and build the state.
 
         Args:
-            device_id: The device ID.
-            location: Current device location.
+            device: The device to fetch state for.
+            now: Time of this update, used for the online check.
 
         Returns:
-            List of geofences.
+            The device state.
         """
-        if not location:
-            return self._geofences
-
-        # Calculate distance to each geofence
-        result = []
-        for geofence in self._geofences:
-            # Calculate if device is inside using Haversine formula
-            is_inside = self._is_inside_geofence(
-                location.latitude,
-                location.longitude,
-                geofence.latitude,
-                geofence.longitude,
-                geofence.radius,
+        (
+            latest,
+            chat_messages,
+            alarms,
+            silence_times,
+            tracking_mode,
+        ) = await self.client.fetch_device_bundle(device.id)
+
+        location: LocationInfo | None = None
+        last_seen: datetime | None = None
+        battery_level = 0
+        signal_strength = 0
+
+        if latest:
+            location = LocationInfo(
+                lat=latest.latitude,
+                lng=latest.longitude,
+                accuracy=0,
+                timestamp=latest.date,
             )
+            last_seen = latest.last_response
+            battery_level = latest.battery_level
+            signal_strength = latest.signal_strength
+
+        # Find last WATCH/DEVICE message in the chat history
+        last_message = None
+        for msg in reversed(chat_messages):
+            if msg.sender in WATCH_SENDERS:
+                last_message = msg
+                break
+
+        return AnioDeviceState(
+            device=device,
+            location=location,
+            geofences=self._geofences,
+            last_seen=last_seen,
+            is_online=self._calculate_online_status(last_seen, now),
+            battery_level_value=battery_level,
+            signal_strength=signal_strength,
+            last_message=last_message,
+            alarms=alarms,
+            silence_times=silence_times,
+            tracking_mode=tracking_mode,
+        )
 
-            # Create a copy with the calculated status
-            # We store this in the geofence's model_extra or a wrapper
-            result.append(geofence)
-            # Note: The actual is_inside status is calculated per-device
-            # and stored in coordinator data
+    def _calculate_online_status(
+        self,
+        last_seen: datetime | None,
+        now: datetime,
+    ) -> bool:
+        """Calculate if a device is online based on last seen time.
 
-        return result
+        Args:
+            last_seen: Last seen datetime.
+            now: Current time, read once per update.
 
-    def _is_inside_geofence(
+        Returns:
+            True if device is considered online.
+        """
+        if last_seen is None:
+            return False
+
+        return last_seen > now - ONLINE_THRESHOLD
+
+    def _compute_geofence_presence(
         self,
-        device_lat: float,
-        device_lon: float,
-        fence_lat: float,
-        fence_lon: float,
-        radius_meters: int,
-    ) -> bool:
-        """Check if device is inside a geofence using Haversine formula.
+        states: dict[str, AnioDeviceState],
+    ) -> dict[tuple[str, str], bool]:
+        """Check every device against every geofence once per update.
 
         Args:
-            device_lat: Device latitude.
-            device_lon: Device longitude.
-            fence_lat: Geofence center latitude.
-            fence_lon: Geofence center longitude.
-            radius_meters: Geofence radius in meters.
+            states: Device states keyed by device ID.
 
         Returns:
-            True if device is inside the geofence.
+            Mapping of (device ID, geofence ID) to whether the device is inside.
         """
-        # Earth's radius in meters
-        earth_radius = 6371000
-
-        # Convert to radians
-        lat1 = math.radians(device_lat)
-        lat2 = math.radians(fence_lat)
-        delta_lat = math.radians(fence_lat - device_lat)
-        delta_lon = math.radians(fence_lon - device_lon)
-
-        # Haversine formula
-        a = (
-            math.sin(delta_lat / 2) ** 2
-            + math.cos(lat1) * math.cos(lat2) * math.sin(delta_lon / 2) ** 2
-        )
-        c = 2 * math.atan2(math.sqrt(a), math.sqrt(1 - a))
-        distance = earth_radius * c
+        # Convert each fence once rather than once per device
+        fences = []
+        for geofence in self._geofences:
+            fence_lat = math.radians(geofence.latitude)
+            fences.append(
+                (
+                    geofence.id,
+                    fence_lat,
+                    math.radians(geofence.longitude),
+                    math.cos(fence_lat),
+                    geofence.radius,
+                )
+            )
 
-        return distance <= radius_meters
+        presence: dict[tuple[str, str], bool] = {}
+        for device_id, state in states.items():
+            if not (location := state.location):
+                continue
+            lat = math.radians(location.latitude)
+            lon = math.radians(location.longitude)
+            cos_lat = math.cos(lat)
+            for fence_id, fence_lat, fence_lon, fence_cos_lat, radius in fences:
+                presence[(device_id, fence_id)] = _is_within_radius(
+                    lat, lon, cos_lat, fence_lat, fence_lon, fence_cos_lat, radius
+                )
+        return presence
 
     def is_device_in_geofence(
         self,
@@ -258,6 +373,8 @@ class AnioDataUpdateCoordinator(DataUpdateCoordinator[dict[str, AnioDeviceState]
     ) -> bool:
         """Check if a device is inside a specific geofence.
 
+        Reads the presence map built during the last update.
+
         Args:
             device_id: The device ID.
             geofence_id: The geofence ID.
@@ -265,24 +382,7 @@ class AnioDataUpdateCoordinator(DataUpdateCoordinator[dict[str, AnioDeviceState]
         Returns:
             True if device is inside the geofence.
         """
-        if not self.data or device_id not in self.data:
-            return False
-
-        state = self.data[device_id]
-        if not state.location:
-            return False
-
-        for geofence in self._geofences:
-            if geofence.id == geofence_id:
-                return self._is_inside_geofence(
-                    state.location.latitude,
-                    state.location.longitude,
-                    geofence.latitude,
-                    geofence.longitude,
-                    geofence.radius,
-                )
-
-        return False
+        return self._geofence_presence.get((device_id, geofence_id), False)
 
     async def _process_messages(self, activity: list[Any]) -> None:
         """Process activity items for incoming messages and fire events.
@@ -302,7 +402,7 @@ class AnioDataUpdateCoordinator(DataUpdateCoordinator[dict[str, AnioDeviceState]
                 message_id = message_data.get("id")
 
                 # Skip if we've already processed this message
-                if message_id and message_id in self._seen_message_ids:
+                if message_id and message_id in self._seen_messages:
                     continue
 
                 # Check if it's from the watch
@@ -335,14 +435,44 @@ class AnioDataUpdateCoordinator(DataUpdateCoordinator[dict[str, AnioDeviceState]
 
                 # Mark message as seen
                 if message_id:
-                    self._seen_message_ids.add(message_id)
-
-                    # Limit the size of seen messages set
-                    if len(self._seen_message_ids) > 1000:
-                        # Remove oldest entries (convert to list, slice, back to set)
-                        self._seen_message_ids = set(
-                            list(self._seen_message_ids)[-500:]
-                        )
+                    self._seen_messages[message_id] = None
+                    # Forget the oldest ID once the window is full
+                    if len(self._seen_messages) > MAX_SEEN_MESSAGES:
+                        self._seen_messages.popitem(last=False)
+
+    @callback
+    def async_apply_device_settings(self, device_id: str, **settings: Any) -> None:
+        """Apply a confirmed settings change to the cached device state.
+
+        Lets entities show a setting the API has already accepted without
+        polling every endpoint again; the next scheduled poll reconciles it.
+
+        Args:
+            device_id: The device ID.
+            **settings: DeviceSettings fields to set (e.g. ring_profile="SILENT").
+        """
+        if not self.data or (state := self.data.get(device_id)) is None:
+            return
+
+        device_settings = state.device.settings
+        for key, value in settings.items():
+            setattr(device_settings, key, value)
+        self.async_update_listeners()
+
+    @callback
+    def async_apply_silence_times_enabled(self, device_id: str, enabled: bool) -> None:
+        """Apply a confirmed silence time toggle to the cached device state.
+
+        Args:
+            device_id: The device ID.
+            enabled: Whether all silence times are now enabled.
+        """
+        if not self.data or (state := self.data.get(device_id)) is None:
+            return
+
+        for silence_time in state.silence_times:
+            silence_time.enabled = enabled
+        self.async_update_listeners()
 
     async def async_request_refresh_for_device(self, device_id: str) -> None:
         """Request a data refresh after a device action.
@@ -24,10 +24,9 @@ async def async_setup_entry(
         "coordinator"
     ]
 
-    entities: list[TrackerEntity] = []
-
-    for device_id in coordinator.data:
-        entities.append(AnioDeviceTracker(coordinator, device_id))
+    entities: list[TrackerEntity] = [
+        AnioDeviceTracker(coordinator, device_id) for device_id in coordinator.data
+    ]
 
     async_add_entities(entities)
 
@@ -35,6 +34,8 @@ async def async_setup_entry(
 class AnioDeviceTracker(AnioEntity, TrackerEntity):
     """Device tracker entity for ANIO watch location."""
 
+    _attr_name = "Location"
+
     def __init__(
         self,
         coordinator: AnioDataUpdateCoordinator,
@@ -49,11 +50,6 @@ class AnioDeviceTracker(AnioEntity, TrackerEntity):
         super().__init__(coordinator, device_id)
         self._attr_unique_id = f"{device_id}_location"
 
-    @property
-    def name(self) -> str:
-        """Return the name of the tracker."""
-        return "Location"
-
     @property
     def source_type(self) -> SourceType:
         """Return the source type."""
@@ -62,7 +58,7 @@ class AnioDeviceTracker(AnioEntity, TrackerEntity):
     @property
     def latitude(self) -> float | None:
         """Return latitude value of the device."""
-        device_state = self.coordinator.data.get(self._device_id)
+        device_state = self.device_state
         if device_state and device_state.location:
             return device_state.location.latitude
         return None
@@ -70,7 +66,7 @@ class AnioDeviceTracker(AnioEntity, TrackerEntity):
     @property
     def longitude(self) -> float | None:
         """Return longitude value of the device."""
-        device_state = self.coordinator.data.get(self._device_id)
+        device_state = self.device_state
         if device_state and device_state.location:
             return device_state.location.longitude
         return None
@@ -78,7 +74,7 @@ class AnioDeviceTracker(AnioEntity, TrackerEntity):
     @property
     def location_accuracy(self) -> int | None:
         """Return the location accuracy in meters."""
-        device_state = self.coordinator.data.get(self._device_id)
+        device_state = self.device_state
         if device_state and device_state.location:
             return device_state.location.accuracy
         return None
@@ -86,7 +82,7 @@ class AnioDeviceTracker(AnioEntity, TrackerEntity):
     @property
     def extra_state_attributes(self) -> dict[str, Any] | None:
         """Return additional state attributes."""
-        device_state = self.coordinator.data.get(self._device_id)
+        device_state = self.device_state
         if device_state and device_state.location:
             return {
                 "accuracy": device_state.location.accuracy,
@@ -2,8 +2,10 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
+from homeassistant.core import callback
 from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
@@ -34,14 +36,55 @@ class AnioEntity(CoordinatorEntity["AnioDataUpdateCoordinator"]):
         """
         super().__init__(coordinator)
         self._device_id = device_id
+        self._last_written: tuple[Any, ...] | None = None
+        self._async_update_attrs()
 
-    @property
+    @cached_property
     def device_state(self) -> AnioDeviceState | None:
-        """Get the current device state from coordinator data."""
+        """Get the current device state from coordinator data.
+
+        Cached until the next coordinator update, so the properties read
+        while writing the entity state share a single lookup.
+        """
         if self.coordinator.data:
             return self.coordinator.data.get(self._device_id)
         return None
 
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Drop the cached device state and write the new entity state.
+
+        The write is skipped when availability and the entity's state
+        inputs are unchanged since the last write from this handler.
+        """
+        self.__dict__.pop("device_state", None)
+        self._async_update_attrs()
+
+        if (inputs := self._state_inputs()) is not None:
+            written = (self.available, *inputs)
+            if written == self._last_written:
+                return
+            self._last_written = written
+        super()._handle_coordinator_update()
+
+    @callback
+    def _async_update_attrs(self) -> None:
+        """Update _attr_ values derived from the device state.
+
+        Runs once at construction and once per coordinator update, so
+        subclasses can precompute state instead of deriving it in
+        properties that are read several times per state write.
+        """
+
+    def _state_inputs(self) -> tuple[Any, ...] | None:
+        """Return the precomputed values the entity state is written from.
+
+        Returns:
+            The values to compare between coordinator updates, or None to
+            write the state on every update.
+        """
+        return None
+
     @property
     def available(self) -> bool:
         """Return True if entity is available."""
@@ -92,13 +135,23 @@ class AnioGeofenceEntity(CoordinatorEntity["AnioDataUpdateCoordinator"]):
         self._device_id = device_id
         self._geofence = geofence
 
-    @property
+    @cached_property
     def device_state(self) -> AnioDeviceState | None:
-        """Get the current device state from coordinator data."""
+        """Get the current device state from coordinator data.
+
+        Cached until the next coordinator update, so the properties read
+        while writing the entity state share a single lookup.
+        """
         if self.coordinator.data:
             return self.coordinator.data.get(self._device_id)
         return None
 
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Drop the cached device state and write the new entity state."""
+        self.__dict__.pop("device_state", None)
+        super()._handle_coordinator_update()
+
     @property
     def available(self) -> bool:
         """Return True if entity is available."""
@@ -24,17 +24,14 @@ async def async_setup_entry(
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Set up ANIO notify entities from a config entry."""
-    coordinator: AnioDataUpdateCoordinator = hass.data[DOMAIN][entry.entry_id][
-        "coordinator"
-    ]
-    client: AnioApiClient = hass.data[DOMAIN][entry.entry_id]["client"]
-
-    entities: list[NotifyEntity] = []
+    entry_data = hass.data[DOMAIN][entry.entry_id]
+    coordinator: AnioDataUpdateCoordinator = entry_data["coordinator"]
+    client: AnioApiClient = entry_data["client"]
 
-    for device_id in coordinator.data:
-        entities.append(
-            AnioNotifyEntity(coordinator, client, device_id)
-        )
+    entities: list[NotifyEntity] = [
+        AnioNotifyEntity(coordinator, client, device_id)
+        for device_id in coordinator.data
+    ]
 
     async_add_entities(entities)
 
@@ -42,6 +39,8 @@ async def async_setup_entry(
 class AnioNotifyEntity(AnioEntity, NotifyEntity):
     """Notify entity for sending messages to ANIO watch."""
 
+    _attr_name = "Message"
+
     def __init__(
         self,
         coordinator: AnioDataUpdateCoordinator,
@@ -59,11 +58,6 @@ class AnioNotifyEntity(AnioEntity, NotifyEntity):
         self._client = client
         self._attr_unique_id = f"{device_id}_notify"
 
-    @property
-    def name(self) -> str:
-        """Return the name of the entity."""
-        return "Message"
-
     async def async_send_message(
         self,
         message: str,
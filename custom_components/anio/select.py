@@ -3,11 +3,12 @@
 from __future__ import annotations
 
 import logging
+from typing import Any
 
 from homeassistant.components.select import SelectEntity
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import EntityCategory
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
 from .api import AnioApiClient
@@ -24,15 +25,14 @@ async def async_setup_entry(
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Set up ANIO select entities from a config entry."""
-    coordinator: AnioDataUpdateCoordinator = hass.data[DOMAIN][entry.entry_id][
-        "coordinator"
-    ]
-    client: AnioApiClient = hass.data[DOMAIN][entry.entry_id]["client"]
-
-    entities: list[SelectEntity] = []
+    entry_data = hass.data[DOMAIN][entry.entry_id]
+    coordinator: AnioDataUpdateCoordinator = entry_data["coordinator"]
+    client: AnioApiClient = entry_data["client"]
 
-    for device_id in coordinator.data:
-        entities.append(AnioRingProfileSelect(coordinator, client, device_id))
+    entities: list[SelectEntity] = [
+        AnioRingProfileSelect(coordinator, client, device_id)
+        for device_id in coordinator.data
+    ]
 
     async_add_entities(entities)
 
@@ -40,6 +40,7 @@ async def async_setup_entry(
 class AnioRingProfileSelect(AnioEntity, SelectEntity):
     """Select entity for the ANIO watch ring profile."""
 
+    _attr_name = "Ring Profile"
     _attr_icon = "mdi:bell-ring"
     _attr_entity_category = EntityCategory.CONFIG
     _attr_options = RING_PROFILES
@@ -55,22 +56,23 @@ class AnioRingProfileSelect(AnioEntity, SelectEntity):
         self._client = client
         self._attr_unique_id = f"{device_id}_ring_profile"
 
-    @property
-    def name(self) -> str:
-        """Return the name of the select."""
-        return "Ring Profile"
+    @callback
+    def _async_update_attrs(self) -> None:
+        """Update the current ring profile."""
+        device_state = self.device_state
+        self._attr_current_option = (
+            device_state.device.settings.ring_profile if device_state else None
+        )
 
-    @property
-    def current_option(self) -> str | None:
+    def _state_inputs(self) -> tuple[Any, ...]:
         """Return the current ring profile."""
-        device_state = self.coordinator.data.get(self._device_id)
-        if device_state:
-            return device_state.device.settings.ring_profile
-        return None
+        return (self.current_option,)
 
     async def async_select_option(self, option: str) -> None:
         """Set the ring profile."""
         await self._client.update_device_settings(
             self._device_id, ringProfile=option
         )
-        await self.coordinator.async_request_refresh()
+        self.coordinator.async_apply_device_settings(
+            self._device_id, ring_profile=option
+        )
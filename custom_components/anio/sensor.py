@@ -2,7 +2,8 @@
 
 from __future__ import annotations
 
-from datetime import datetime
+from operator import attrgetter
+from typing import Any
 
 from homeassistant.components.sensor import (
     SensorDeviceClass,
@@ -11,7 +12,7 @@ from homeassistant.components.sensor import (
 )
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import PERCENTAGE, EntityCategory
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
 from .const import DOMAIN
@@ -29,26 +30,34 @@ async def async_setup_entry(
         "coordinator"
     ]
 
-    entities: list[SensorEntity] = []
-
-    for device_id in coordinator.data:
-        entities.extend(
-            [
-                AnioBatterySensor(coordinator, device_id),
-                AnioLastSeenSensor(coordinator, device_id),
-                AnioSignalStrengthSensor(coordinator, device_id),
-                AnioLastMessageSensor(coordinator, device_id),
-                AnioNextAlarmSensor(coordinator, device_id),
-                AnioTrackingModeSensor(coordinator, device_id),
-            ]
+    entities: list[SensorEntity] = [
+        sensor_class(coordinator, device_id)
+        for device_id in coordinator.data
+        for sensor_class in (
+            AnioBatterySensor,
+            AnioLastSeenSensor,
+            AnioSignalStrengthSensor,
+            AnioLastMessageSensor,
+            AnioNextAlarmSensor,
+            AnioTrackingModeSensor,
         )
+    ]
 
     async_add_entities(entities)
 
 
-class AnioBatterySensor(AnioEntity, SensorEntity):
+class AnioSensorEntity(AnioEntity, SensorEntity):
+    """Base class for ANIO sensors with precomputed values."""
+
+    def _state_inputs(self) -> tuple[Any, ...]:
+        """Return the native value and extra attributes."""
+        return (self.native_value, self.extra_state_attributes)
+
+
+class AnioBatterySensor(AnioSensorEntity):
     """Sensor entity for ANIO watch battery level."""
 
+    _attr_name = "Battery"
     _attr_device_class = SensorDeviceClass.BATTERY
     _attr_native_unit_of_measurement = PERCENTAGE
     _attr_state_class = SensorStateClass.MEASUREMENT
@@ -63,23 +72,17 @@ class AnioBatterySensor(AnioEntity, SensorEntity):
         super().__init__(coordinator, device_id)
         self._attr_unique_id = f"{device_id}_battery"
 
-    @property
-    def name(self) -> str:
-        """Return the name of the sensor."""
-        return "Battery"
-
-    @property
-    def native_value(self) -> int | None:
-        """Return the battery level."""
-        device_state = self.coordinator.data.get(self._device_id)
-        if device_state:
-            return device_state.battery_level
-        return None
+    @callback
+    def _async_update_attrs(self) -> None:
+        """Update the battery level."""
+        device_state = self.device_state
+        self._attr_native_value = device_state.battery_level if device_state else None
 
 
-class AnioLastSeenSensor(AnioEntity, SensorEntity):
+class AnioLastSeenSensor(AnioSensorEntity):
     """Sensor entity for ANIO watch last seen timestamp."""
 
+    _attr_name = "Last Seen"
     _attr_device_class = SensorDeviceClass.TIMESTAMP
     _attr_entity_category = EntityCategory.DIAGNOSTIC
 
@@ -92,23 +95,17 @@ class AnioLastSeenSensor(AnioEntity, SensorEntity):
         super().__init__(coordinator, device_id)
         self._attr_unique_id = f"{device_id}_last_seen"
 
-    @property
-    def name(self) -> str:
-        """Return the name of the sensor."""
-        return "Last Seen"
+    @callback
+    def _async_update_attrs(self) -> None:
+        """Update the last seen timestamp."""
+        device_state = self.device_state
+        self._attr_native_value = device_state.last_seen if device_state else None
 
-    @property
-    def native_value(self) -> datetime | None:
-        """Return the last seen timestamp."""
-        device_state = self.coordinator.data.get(self._device_id)
-        if device_state:
-            return device_state.last_seen
-        return None
 
-
-class AnioSignalStrengthSensor(AnioEntity, SensorEntity):
+class AnioSignalStrengthSensor(AnioSensorEntity):
     """Sensor entity for ANIO watch signal strength."""
 
+    _attr_name = "Signal Strength"
     _attr_icon = "mdi:signal"
     _attr_native_unit_of_measurement = PERCENTAGE
     _attr_state_class = SensorStateClass.MEASUREMENT
@@ -123,23 +120,19 @@ class AnioSignalStrengthSensor(AnioEntity, SensorEntity):
         super().__init__(coordinator, device_id)
         self._attr_unique_id = f"{device_id}_signal_strength"
 
-    @property
-    def name(self) -> str:
-        """Return the name of the sensor."""
-        return "Signal Strength"
-
-    @property
-    def native_value(self) -> int | None:
-        """Return the signal strength."""
-        device_state = self.coordinator.data.get(self._device_id)
-        if device_state:
-            return device_state.signal_strength
-        return None
+    @callback
+    def _async_update_attrs(self) -> None:
+        """Update the signal strength."""
+        device_state = self.device_state
+        self._attr_native_value = (
+            device_state.signal_strength if device_state else None
+        )
 
 
-class AnioLastMessageSensor(AnioEntity, SensorEntity):
+class AnioLastMessageSensor(AnioSensorEntity):
     """Sensor entity for the last message received from the ANIO watch."""
 
+    _attr_name = "Last Message"
     _attr_icon = "mdi:message-text"
 
     def __init__(
@@ -151,37 +144,28 @@ class AnioLastMessageSensor(AnioEntity, SensorEntity):
         super().__init__(coordinator, device_id)
         self._attr_unique_id = f"{device_id}_last_message"
 
-    @property
-    def name(self) -> str:
-        """Return the name of the sensor."""
-        return "Last Message"
-
-    @property
-    def native_value(self) -> str | None:
-        """Return the last message text."""
-        device_state = self.coordinator.data.get(self._device_id)
-        if device_state and device_state.last_message:
-            return device_state.last_message.text
-        return None
-
-    @property
-    def extra_state_attributes(self) -> dict[str, str | bool | None] | None:
-        """Return additional message attributes."""
-        device_state = self.coordinator.data.get(self._device_id)
-        if device_state and device_state.last_message:
-            msg = device_state.last_message
-            return {
-                "sender": msg.sender,
-                "type": msg.type,
-                "created_at": msg.created_at.isoformat(),
-                "is_read": msg.is_read,
-            }
-        return None
-
-
-class AnioNextAlarmSensor(AnioEntity, SensorEntity):
+    @callback
+    def _async_update_attrs(self) -> None:
+        """Update the last message text and its metadata."""
+        device_state = self.device_state
+        if not device_state or not (msg := device_state.last_message):
+            self._attr_native_value = None
+            self._attr_extra_state_attributes = None
+            return
+
+        self._attr_native_value = msg.text
+        self._attr_extra_state_attributes = {
+            "sender": msg.sender,
+            "type": msg.type,
+            "created_at": msg.created_at.isoformat(),
+            "is_read": msg.is_read,
+        }
+
+
+class AnioNextAlarmSensor(AnioSensorEntity):
     """Sensor entity for the next alarm on the ANIO watch."""
 
+    _attr_name = "Next Alarm"
     _attr_icon = "mdi:alarm"
 
     def __init__(
@@ -193,49 +177,30 @@ class AnioNextAlarmSensor(AnioEntity, SensorEntity):
         super().__init__(coordinator, device_id)
         self._attr_unique_id = f"{device_id}_next_alarm"
 
-    @property
-    def name(self) -> str:
-        """Return the name of the sensor."""
-        return "Next Alarm"
-
-    @property
-    def native_value(self) -> str | None:
-        """Return the next enabled alarm time."""
-        device_state = self.coordinator.data.get(self._device_id)
-        if not device_state:
-            return None
-
-        enabled_alarms = [a for a in device_state.alarms if a.enabled]
-        if not enabled_alarms:
-            return None
-
-        # Sort by time and return the earliest
-        enabled_alarms.sort(key=lambda a: a.time)
-        return enabled_alarms[0].time
-
-    @property
-    def extra_state_attributes(self) -> dict[str, int | str | None] | None:
-        """Return additional alarm attributes."""
-        device_state = self.coordinator.data.get(self._device_id)
+    @callback
+    def _async_update_attrs(self) -> None:
+        """Update the next enabled alarm time and alarm counts."""
+        device_state = self.device_state
         if not device_state:
-            return None
+            self._attr_native_value = None
+            self._attr_extra_state_attributes = None
+            return
 
         enabled_alarms = [a for a in device_state.alarms if a.enabled]
-        next_alarm = None
-        if enabled_alarms:
-            enabled_alarms.sort(key=lambda a: a.time)
-            next_alarm = enabled_alarms[0]
+        next_alarm = min(enabled_alarms, key=attrgetter("time"), default=None)
 
-        return {
+        self._attr_native_value = next_alarm.time if next_alarm else None
+        self._attr_extra_state_attributes = {
             "alarm_count": len(device_state.alarms),
             "enabled_count": len(enabled_alarms),
             "next_alarm_days": ", ".join(next_alarm.days) if next_alarm else None,
         }
 
 
-class AnioTrackingModeSensor(AnioEntity, SensorEntity):
+class AnioTrackingModeSensor(AnioSensorEntity):
     """Sensor entity for the ANIO watch tracking mode."""
 
+    _attr_name = "Tracking Mode"
     _attr_icon = "mdi:crosshairs-gps"
     _attr_entity_category = EntityCategory.DIAGNOSTIC
 
@@ -248,15 +213,8 @@ class AnioTrackingModeSensor(AnioEntity, SensorEntity):
         super().__init__(coordinator, device_id)
         self._attr_unique_id = f"{device_id}_tracking_mode"
 
-    @property
-    def name(self) -> str:
-        """Return the name of the sensor."""
-        return "Tracking Mode"
-
-    @property
-    def native_value(self) -> str | None:
-        """Return the current tracking mode."""
-        device_state = self.coordinator.data.get(self._device_id)
-        if device_state:
-            return device_state.tracking_mode
-        return None
+    @callback
+    def _async_update_attrs(self) -> None:
+        """Update the current tracking mode."""
+        device_state = self.device_state
+        self._attr_native_value = device_state.tracking_mode if device_state else None
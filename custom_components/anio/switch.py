@@ -8,7 +8,7 @@ from typing import Any
 from homeassistant.components.switch import SwitchEntity
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import EntityCategory
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
 from .api import AnioApiClient
@@ -25,15 +25,14 @@ async def async_setup_entry(
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Set up ANIO switch entities from a config entry."""
-    coordinator: AnioDataUpdateCoordinator = hass.data[DOMAIN][entry.entry_id][
-        "coordinator"
-    ]
-    client: AnioApiClient = hass.data[DOMAIN][entry.entry_id]["client"]
-
-    entities: list[SwitchEntity] = []
+    entry_data = hass.data[DOMAIN][entry.entry_id]
+    coordinator: AnioDataUpdateCoordinator = entry_data["coordinator"]
+    client: AnioApiClient = entry_data["client"]
 
-    for device_id in coordinator.data:
-        entities.append(AnioSilenceTimeSwitch(coordinator, client, device_id))
+    entities: list[SwitchEntity] = [
+        AnioSilenceTimeSwitch(coordinator, client, device_id)
+        for device_id in coordinator.data
+    ]
 
     async_add_entities(entities)
 
@@ -41,6 +40,7 @@ async def async_setup_entry(
 class AnioSilenceTimeSwitch(AnioEntity, SwitchEntity):
     """Switch entity for toggling silence times on the ANIO watch."""
 
+    _attr_name = "Silence Time"
     _attr_icon = "mdi:volume-off"
     _attr_entity_category = EntityCategory.CONFIG
 
@@ -55,48 +55,40 @@ class AnioSilenceTimeSwitch(AnioEntity, SwitchEntity):
         self._client = client
         self._attr_unique_id = f"{device_id}_silence_time"
 
-    @property
-    def name(self) -> str:
-        """Return the name of the switch."""
-        return "Silence Time"
+    @callback
+    def _async_update_attrs(self) -> None:
+        """Update the switch state and silence time period details."""
+        device_state = self.device_state
+        if not device_state:
+            self._attr_is_on = False
+            self._attr_extra_state_attributes = None
+            return
+
+        silence_times = device_state.silence_times
+        self._attr_is_on = any(st.enabled for st in silence_times)
+        self._attr_extra_state_attributes = {
+            "silence_time_count": len(silence_times),
+            "periods": [
+                {
+                    "start": st.start_time,
+                    "end": st.end_time,
+                    "days": ", ".join(st.days),
+                    "enabled": st.enabled,
+                }
+                for st in silence_times
+            ],
+        }
 
-    @property
-    def is_on(self) -> bool:
-        """Return true if any silence time is enabled."""
-        device_state = self.coordinator.data.get(self._device_id)
-        if device_state:
-            return any(st.enabled for st in device_state.silence_times)
-        return False
+    def _state_inputs(self) -> tuple[Any, ...]:
+        """Return the switch state and extra attributes."""
+        return (self.is_on, self.extra_state_attributes)
 
     async def async_turn_on(self, **kwargs: Any) -> None:
         """Enable silence times."""
         await self._client.enable_silence_times(self._device_id)
-        await self.coordinator.async_request_refresh()
+        self.coordinator.async_apply_silence_times_enabled(self._device_id, True)
 
     async def async_turn_off(self, **kwargs: Any) -> None:
         """Disable silence times."""
         await self._client.disable_silence_times(self._device_id)
-        await self.coordinator.async_request_refresh()
-
-    @property
-    def extra_state_attributes(self) -> dict[str, Any] | None:
-        """Return silence time period details."""
-        device_state = self.coordinator.data.get(self._device_id)
-        if not device_state:
-            return None
-
-        periods = []
-        for st in device_state.silence_times:
-            periods.append(
-                {
-                    "start": st.start_time,
-                    "end": st.end_time,
-                    "days": ", ".join(st.days),
-                    "enabled": st.enabled,
-                }
-            )
-
-        return {
-            "silence_time_count": len(device_state.silence_times),
-            "periods": periods,
-        }
+        self.coordinator.async_apply_silence_times_enabled(self._device_id, False)
@@ -7,8 +7,14 @@ from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
-from custom_components.anio.api import AnioAuth, AnioAuthError, AnioOtpRequiredError
+from custom_components.anio.api import (
+    AnioAuth,
+    AnioAuthError,
+    AnioInvalidOtpError,
+    AnioOtpRequiredError,
+)
 from custom_components.anio.api.models import AuthTokens
+from custom_components.anio.api.util import json_loads
 
 
 class TestAnioAuth:
@@ -94,6 +100,25 @@ class TestAnioAuth:
         )
         assert auth.is_token_valid is False
 
+    def test_is_token_valid_within_refresh_buffer(
+        self, mock_session: MagicMock
+    ) -> None:
+        """Test is_token_valid returns False when expiry is inside the buffer."""
+        # Token still technically valid but expiring before the refresh buffer
+        soon_exp = int((datetime.now(timezone.utc) + timedelta(minutes=1)).timestamp())
+        import base64
+        import json
+        payload = base64.urlsafe_b64encode(
+            json.dumps({"exp": soon_exp}).encode()
+        ).decode().rstrip("=")
+        token = f"header.{payload}.signature"
+
+        auth = AnioAuth(
+            session=mock_session,
+            access_token=token,
+        )
+        assert auth.is_token_valid is False
+
     @pytest.mark.asyncio
     async def test_login_success(self, auth: AnioAuth, mock_session: MagicMock) -> None:
         """Test successful login."""
@@ -118,6 +143,8 @@ class TestAnioAuth:
         assert tokens.refresh_token == "new_refresh_token"
         assert auth.access_token == "new_access_token"
         assert auth.refresh_token == "new_refresh_token"
+        assert auth.request_headers["Authorization"] == "Bearer new_access_token"
+        assert auth.request_headers["app-uuid"] == auth.app_uuid
 
     @pytest.mark.asyncio
     async def test_login_invalid_credentials(
@@ -134,6 +161,28 @@ class TestAnioAuth:
         with pytest.raises(AnioAuthError, match="Invalid email or password"):
             await auth.login()
 
+    @pytest.mark.asyncio
+    async def test_login_otp_rejected(
+        self, auth: AnioAuth, mock_session: MagicMock
+    ) -> None:
+        """Test a refused OTP code is told apart from bad credentials."""
+        mock_response = MagicMock()
+        mock_response.status = 400
+        mock_response.content.read = AsyncMock(side_effect=[b"Invalid code", b""])
+        mock_response.__aenter__ = AsyncMock(return_value=mock_response)
+        mock_response.__aexit__ = AsyncMock(return_value=None)
+
+        mock_session.post.return_value = mock_response
+
+        with pytest.raises(AnioInvalidOtpError):
+            await auth.login(otp_code="000000")
+
+        mock_response.status = 401
+
+        with pytest.raises(AnioAuthError) as exc_info:
+            await auth.login(otp_code="000000")
+        assert not isinstance(exc_info.value, AnioInvalidOtpError)
+
     @pytest.mark.asyncio
     async def test_login_otp_required(
         self, auth: AnioAuth, mock_session: MagicMock
@@ -180,8 +229,8 @@ class TestAnioAuth:
         assert tokens.access_token == "new_access_token"
         # Verify OTP was included in request
         call_kwargs = mock_session.post.call_args
-        assert "json" in call_kwargs.kwargs
-        assert call_kwargs.kwargs["json"]["otpCode"] == "123456"
+        assert "data" in call_kwargs.kwargs
+        assert json_loads(call_kwargs.kwargs["data"])["otpCode"] == "123456"
 
     @pytest.mark.asyncio
     async def test_refresh_success(self, mock_session: MagicMock) -> None:
@@ -289,6 +338,62 @@ class TestAnioAuth:
 
         assert result == "new_token"
 
+    @pytest.mark.asyncio
+    async def test_ensure_valid_token_concurrent_refresh(
+        self, mock_session: MagicMock
+    ) -> None:
+        """Test concurrent callers share a single token refresh."""
+        import asyncio
+        import base64
+        import json
+
+        def make_token(exp: int) -> str:
+            payload = base64.urlsafe_b64encode(
+                json.dumps({"exp": exp}).encode()
+            ).decode().rstrip("=")
+            return f"header.{payload}.signature"
+
+        now = datetime.now(timezone.utc)
+        expired = make_token(int((now - timedelta(hours=1)).timestamp()))
+        fresh = make_token(int((now + timedelta(hours=1)).timestamp()))
+
+        auth = AnioAuth(
+            session=mock_session,
+            access_token=expired,
+            refresh_token="refresh_token",
+        )
+
+        mock_response = MagicMock()
+        mock_response.status = 200
+        mock_response.json = AsyncMock(return_value={"accessToken": fresh})
+        mock_response.__aenter__ = AsyncMock(return_value=mock_response)
+        mock_response.__aexit__ = AsyncMock(return_value=None)
+
+        mock_session.post.return_value = mock_response
+
+        results = await asyncio.gather(
+            *(auth.ensure_valid_token() for _ in range(5))
+        )
+
+        assert results == [fresh] * 5
+        assert mock_session.post.call_count == 1
+
+    def test_get_cached_valid_token(self, mock_session: MagicMock) -> None:
+        """Test the synchronous token fast path honours the refresh deadline."""
+        future_exp = int((datetime.now(timezone.utc) + timedelta(hours=1)).timestamp())
+        import base64
+        import json
+        payload = base64.urlsafe_b64encode(
+            json.dumps({"exp": future_exp}).encode()
+        ).decode().rstrip("=")
+        token = f"header.{payload}.signature"
+
+        auth = AnioAuth(session=mock_session, access_token=token)
+
+        assert auth.get_cached_valid_token(future_exp - 3600) == token
+        assert auth.get_cached_valid_token(future_exp) is None
+        assert AnioAuth(session=mock_session).get_cached_valid_token(0) is None
+
     @pytest.mark.asyncio
     async def test_logout(self, mock_session: MagicMock) -> None:
         """Test logout."""
@@ -309,3 +414,27 @@ class TestAnioAuth:
 
         assert auth.access_token is None
         assert auth.refresh_token is None
+
+    @pytest.mark.asyncio
+    async def test_logout_skips_request_for_expired_token(
+        self, mock_session: MagicMock
+    ) -> None:
+        """Test logout clears state without a request when the token expired."""
+        import base64
+        import json
+
+        past_exp = int((datetime.now(timezone.utc) - timedelta(hours=1)).timestamp())
+        payload = base64.urlsafe_b64encode(
+            json.dumps({"exp": past_exp}).encode()
+        ).decode().rstrip("=")
+        auth = AnioAuth(
+            session=mock_session,
+            access_token=f"header.{payload}.signature",
+            refresh_token="refresh_token",
+        )
+
+        await auth.logout()
+
+        mock_session.post.assert_not_called()
+        assert auth.access_token is None
+        assert auth.refresh_token is None
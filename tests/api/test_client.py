@@ -2,20 +2,32 @@
 
 from __future__ import annotations
 
+import io
 from datetime import datetime, timezone
-from unittest.mock import AsyncMock, MagicMock
+from unittest.mock import AsyncMock, MagicMock, call, patch
 
 import pytest
+from pydantic import ValidationError
 
 from custom_components.anio.api import (
     AnioApiClient,
     AnioApiError,
     AnioAuth,
+    AnioConnectionError,
     AnioDeviceNotFoundError,
     AnioMessageTooLongError,
     AnioRateLimitError,
 )
 from custom_components.anio.api.models import ChatMessage, Device, Geofence
+from custom_components.anio.api.util import (
+    ERROR_BODY_LIMIT,
+    ERROR_DRAIN_LIMIT,
+    create_session,
+    json_dumps,
+    json_loads,
+    rate_limit_delay,
+)
+from custom_components.anio.const import API_CONNECTION_LIMIT, RATE_LIMIT_MAX_RETRIES
 
 
 class TestAnioApiClient:
@@ -32,8 +44,14 @@ class TestAnioApiClient:
     def mock_auth(self) -> AsyncMock:
         """Create a mock auth handler."""
         auth = AsyncMock(spec=AnioAuth)
+        auth.get_cached_valid_token = MagicMock(return_value=None)
         auth.ensure_valid_token = AsyncMock(return_value="test_token")
         auth.app_uuid = "test-uuid"
+        auth.request_headers = {
+            "Authorization": "Bearer test_token",
+            "app-uuid": "test-uuid",
+            "Content-Type": "application/json",
+        }
         return auth
 
     @pytest.fixture
@@ -52,7 +70,12 @@ class TestAnioApiClient:
         response = MagicMock()
         response.status = status
         response.json = AsyncMock(return_value=json_data)
+        response.read = AsyncMock(
+            return_value=b"" if json_data is None else json_dumps(json_data)
+        )
         response.text = AsyncMock(return_value=text)
+        body = io.BytesIO(text.encode())
+        response.content.read = AsyncMock(side_effect=lambda n=-1: body.read(n))
         response.headers = headers or {}
         response.__aenter__ = AsyncMock(return_value=response)
         response.__aexit__ = AsyncMock(return_value=None)
@@ -79,9 +102,8 @@ class TestAnioApiClient:
             }
         ]
 
-        mock_session.request.return_value = self._create_mock_response(
-            json_data=device_data
-        )
+        response = self._create_mock_response(json_data=device_data)
+        mock_session.request.return_value = response
 
         devices = await client.get_devices()
 
@@ -89,6 +111,9 @@ class TestAnioApiClient:
         assert isinstance(devices[0], Device)
         assert devices[0].id == "device123"
         assert devices[0].settings.name == "Test Watch"
+        # List endpoints validate the raw body without decoding it to Python first
+        response.read.assert_awaited_once()
+        response.json.assert_not_called()
 
     @pytest.mark.asyncio
     async def test_get_devices_empty(
@@ -134,11 +159,15 @@ class TestAnioApiClient:
         self, client: AnioApiClient, mock_session: MagicMock
     ) -> None:
         """Test getting a device that doesn't exist."""
-        mock_session.request.return_value = self._create_mock_response(status=404)
+        response = self._create_mock_response(status=404)
+        mock_session.request.return_value = response
 
         with pytest.raises(AnioDeviceNotFoundError):
             await client.get_device("nonexistent")
 
+        # The body is drained so the keep-alive connection can be reused
+        response.content.read.assert_awaited_once_with(ERROR_DRAIN_LIMIT)
+
     @pytest.mark.asyncio
     async def test_find_device(
         self, client: AnioApiClient, mock_session: MagicMock
@@ -229,7 +258,8 @@ class TestAnioApiClient:
         await client.send_text_message("device123", "Hello!", username="Mom")
 
         call_kwargs = mock_session.request.call_args.kwargs
-        assert call_kwargs["json"]["username"] == "Mom"
+        assert "json" not in call_kwargs
+        assert json_loads(call_kwargs["data"])["username"] == "Mom"
 
     @pytest.mark.asyncio
     async def test_send_emoji_message_success(
@@ -308,6 +338,24 @@ class TestAnioApiClient:
         assert devices == []
         assert mock_session.request.call_count == 2
 
+    @pytest.mark.asyncio
+    async def test_rate_limit_backoff_applies_to_other_requests(
+        self, client: AnioApiClient, mock_session: MagicMock
+    ) -> None:
+        """Test a 429 holds back other requests until the back-off ends."""
+        mock_session.request.side_effect = [
+            self._create_mock_response(status=429, headers={"Retry-After": "5"}),
+            self._create_mock_response(json_data=[]),
+            self._create_mock_response(json_data=[]),
+        ]
+
+        with patch("custom_components.anio.api.client.asyncio.sleep") as mock_sleep:
+            await client.get_devices()
+            await client.get_geofences()
+
+        assert mock_sleep.await_count == 2
+        assert 4 < mock_sleep.await_args_list[1].args[0] <= 5
+
     @pytest.mark.asyncio
     async def test_rate_limit_max_retries(
         self, client: AnioApiClient, mock_session: MagicMock
@@ -320,7 +368,177 @@ class TestAnioApiClient:
         # Always return 429
         mock_session.request.return_value = rate_limit_response
 
-        with pytest.raises(AnioRateLimitError, match="Max retries exceeded"):
+        with patch("custom_components.anio.api.client.asyncio.sleep"):
+            with pytest.raises(AnioRateLimitError, match="Max retries exceeded"):
+                await client.get_devices()
+
+            # Retry state is per call, so a fresh request gets a full budget
+            assert mock_session.request.call_count == RATE_LIMIT_MAX_RETRIES + 1
+            with pytest.raises(AnioRateLimitError, match="Max retries exceeded"):
+                await client.get_devices()
+
+        assert mock_session.request.call_count == 2 * (RATE_LIMIT_MAX_RETRIES + 1)
+
+    @pytest.mark.asyncio
+    async def test_quota_exhausted_throttles_next_request(
+        self, client: AnioApiClient, mock_session: MagicMock
+    ) -> None:
+        """Test a response with no remaining quota delays the next request."""
+        mock_session.request.return_value = self._create_mock_response(
+            json_data=[],
+            headers={"X-RateLimit-Remaining": "0", "X-RateLimit-Reset": "30"},
+        )
+
+        with patch("custom_components.anio.api.client.asyncio.sleep") as mock_sleep:
+            await client.get_devices()
+            mock_sleep.assert_not_called()
+
+            await client.get_devices()
+
+        mock_sleep.assert_awaited_once()
+        assert 29 < mock_sleep.await_args.args[0] <= 30
+
+    @pytest.mark.asyncio
+    async def test_get_geofences_rejects_out_of_range_coordinates(
+        self, client: AnioApiClient, mock_session: MagicMock
+    ) -> None:
+        """Test geofence coordinates are range-checked."""
+        mock_session.request.return_value = self._create_mock_response(
+            json_data=[
+                {"id": "g1", "name": "Home", "lat": 91.0, "lng": 13.4, "radius": 100}
+            ]
+        )
+
+        with pytest.raises(ValidationError, match="less than or equal to 90"):
+            await client.get_geofences()
+
+    @pytest.mark.asyncio
+    async def test_get_last_location(
+        self, client: AnioApiClient, mock_session: MagicMock
+    ) -> None:
+        """Test the position array is flattened into latitude/longitude."""
+        now = datetime.now(timezone.utc).isoformat()
+        mock_session.request.return_value = self._create_mock_response(
+            json_data={
+                "position": [52.52, 13.405],
+                "batteryLevel": 92,
+                "signalStrength": 60,
+                "positionDeterminedBy": "GPS",
+                "date": now,
+                "lastResponse": now,
+                "deviceId": "device123",
+            }
+        )
+
+        location = await client.get_last_location("device123")
+
+        assert location is not None
+        assert location.latitude == 52.52
+        assert location.longitude == 13.405
+        assert location.position == (52.52, 13.405)
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("position", [None, [52.52]])
+    async def test_get_last_location_malformed_position(
+        self, client: AnioApiClient, mock_session: MagicMock, position: list | None
+    ) -> None:
+        """Test a null or short position is reported as a validation error."""
+        now = datetime.now(timezone.utc).isoformat()
+        mock_session.request.return_value = self._create_mock_response(
+            json_data={
+                "position": position,
+                "batteryLevel": 92,
+                "signalStrength": 60,
+                "positionDeterminedBy": "GPS",
+                "date": now,
+                "lastResponse": now,
+                "deviceId": "device123",
+            }
+        )
+
+        with pytest.raises(ValidationError, match="latitude"):
+            await client.get_last_location("device123")
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("amount", [1, 42])
+    async def test_send_flower(
+        self, client: AnioApiClient, mock_session: MagicMock, amount: int
+    ) -> None:
+        """Test sending flowers posts the encoded amount."""
+        mock_session.request.return_value = self._create_mock_response(status=204)
+
+        await client.send_flower("device123", amount)
+
+        call_kwargs = mock_session.request.call_args.kwargs
+        assert json_loads(call_kwargs["data"]) == {"amount": amount}
+
+    @pytest.mark.asyncio
+    async def test_fetch_device_bundle(self, client: AnioApiClient) -> None:
+        """Test the per-device endpoints are fetched together."""
+        with (
+            patch.object(client, "get_last_location", AsyncMock(return_value=None)),
+            patch.object(client, "get_chat_history", AsyncMock(return_value=[])),
+            patch.object(client, "get_alarms", AsyncMock(return_value=[])),
+            patch.object(client, "get_silence_times", AsyncMock(return_value=[])),
+            patch.object(client, "get_tracking_mode", AsyncMock(return_value="GPS")),
+        ):
+            bundle = await client.fetch_device_bundle("device123")
+
+            client.get_alarms.assert_awaited_once_with("device123")
+
+        assert list(bundle) == [None, [], [], [], "GPS"]
+
+    @pytest.mark.asyncio
+    async def test_fetch_device_bundle_degrades_optional_fields(
+        self, client: AnioApiClient
+    ) -> None:
+        """Test a failed optional endpoint doesn't fail the rest of the bundle."""
+        with (
+            patch.object(client, "get_last_location", AsyncMock(return_value=None)),
+            patch.object(
+                client,
+                "get_chat_history",
+                AsyncMock(side_effect=AnioApiError("Server error", 500)),
+            ),
+            patch.object(client, "get_alarms", AsyncMock(return_value=[])),
+            patch.object(
+                client,
+                "get_silence_times",
+                AsyncMock(side_effect=AnioConnectionError()),
+            ),
+            patch.object(client, "get_tracking_mode", AsyncMock(return_value="GPS")),
+        ):
+            bundle = await client.fetch_device_bundle("device123")
+
+        assert list(bundle) == [None, [], [], [], "GPS"]
+
+    @pytest.mark.asyncio
+    async def test_fetch_device_bundle_raises_location_error(
+        self, client: AnioApiClient
+    ) -> None:
+        """Test a failed location request still fails the bundle."""
+        with (
+            patch.object(
+                client,
+                "get_last_location",
+                AsyncMock(side_effect=AnioConnectionError()),
+            ),
+            patch.object(client, "get_chat_history", AsyncMock(return_value=[])),
+            patch.object(client, "get_alarms", AsyncMock(return_value=[])),
+            patch.object(client, "get_silence_times", AsyncMock(return_value=[])),
+            patch.object(client, "get_tracking_mode", AsyncMock(return_value="GPS")),
+            pytest.raises(AnioConnectionError),
+        ):
+            await client.fetch_device_bundle("device123")
+
+    @pytest.mark.asyncio
+    async def test_timeout_becomes_connection_error(
+        self, client: AnioApiClient, mock_session: MagicMock
+    ) -> None:
+        """Test a request timeout surfaces as AnioConnectionError."""
+        mock_session.request.side_effect = TimeoutError()
+
+        with pytest.raises(AnioConnectionError, match="TimeoutError"):
             await client.get_devices()
 
     @pytest.mark.asyncio
@@ -328,13 +546,32 @@ class TestAnioApiClient:
         self, client: AnioApiClient, mock_session: MagicMock
     ) -> None:
         """Test API error handling."""
-        mock_session.request.return_value = self._create_mock_response(
+        response = self._create_mock_response(
             status=500, text="Internal Server Error"
         )
+        mock_session.request.return_value = response
 
-        with pytest.raises(AnioApiError):
+        with pytest.raises(AnioApiError, match="Internal Server Error"):
             await client.get_devices()
 
+        # Only a bounded prefix of the error body ends up in the message
+        assert response.content.read.await_args_list[0] == call(ERROR_BODY_LIMIT)
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("status", [404, 500])
+    async def test_long_error_body_drained(
+        self, client: AnioApiClient, mock_session: MagicMock, status: int
+    ) -> None:
+        """Test error bodies longer than the message prefix are read to the end."""
+        response = self._create_mock_response(status=status, text="x" * 2000)
+        mock_session.request.return_value = response
+
+        with pytest.raises(AnioApiError) as exc_info:
+            await client.get_devices()
+
+        assert len(exc_info.value.message) < 2000
+        assert await response.content.read() == b""
+
     @pytest.mark.asyncio
     async def test_get_activity(
         self, client: AnioApiClient, mock_session: MagicMock
@@ -357,3 +594,72 @@ class TestAnioApiClient:
 
         assert len(activity) == 1
         assert activity[0].type == "MESSAGE"
+
+    @pytest.mark.asyncio
+    async def test_get_activity_skips_invalid_items(
+        self, client: AnioApiClient, mock_session: MagicMock
+    ) -> None:
+        """Test that one malformed activity item doesn't drop the whole feed."""
+        activity_data = [
+            {
+                "id": "act123",
+                "deviceId": "device123",
+                "type": "MESSAGE",
+                "timestamp": datetime.now(timezone.utc).isoformat(),
+            },
+            {"id": "broken"},
+        ]
+
+        mock_session.request.return_value = self._create_mock_response(
+            json_data=activity_data
+        )
+
+        activity = await client.get_activity()
+
+        assert [item.id for item in activity] == ["act123"]
+
+    @pytest.mark.asyncio
+    async def test_get_activity_truncated_body(
+        self, client: AnioApiClient, mock_session: MagicMock
+    ) -> None:
+        """Test a truncated activity body is reported as an API error."""
+        response = self._create_mock_response()
+        response.read.return_value = b'[{"id": "act123", "deviceId": '
+        mock_session.request.return_value = response
+
+        with pytest.raises(AnioApiError, match="Invalid JSON response"):
+            await client.get_activity()
+
+
+@pytest.mark.asyncio
+async def test_create_session_pools_connections() -> None:
+    """Test the dedicated session is backed by a tuned connection pool."""
+    session = create_session()
+    try:
+        assert session.connector.limit_per_host == API_CONNECTION_LIMIT
+    finally:
+        await session.close()
+
+
+@pytest.mark.parametrize(
+    ("headers", "now", "expected"),
+    [
+        ({}, 0.0, None),
+        ({"Retry-After": "7"}, 0.0, 7.0),
+        ({"Retry-After": "Thu, 01 Jan 1970 00:01:40 GMT"}, 60.0, 40.0),
+        ({"Retry-After": "Thu, 01 Jan 1970 00:00:01 GMT"}, 60.0, 0.0),
+        ({"Retry-After": "soon"}, 0.0, None),
+        ({"X-RateLimit-Reset": "15"}, 0.0, 15.0),
+        (
+            {"Retry-After": "60", "X-RateLimit-Reset": "1000000080"},
+            1_000_000_060.0,
+            20.0,
+        ),
+        ({"RateLimit": '"api";r=0;t=55'}, 0.0, 55.0),
+    ],
+)
+def test_rate_limit_delay(
+    headers: dict[str, str], now: float, expected: float | None
+) -> None:
+    """Test rate limit headers are turned into a wait time."""
+    assert rate_limit_delay(headers, now) == expected
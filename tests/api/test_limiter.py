@@ -0,0 +1,62 @@
+"""Tests for the ANIO adaptive concurrency limiter."""
+
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from custom_components.anio.api.limiter import AdaptiveLimiter
+
+
+class TestAdaptiveLimiter:
+    """Tests for AdaptiveLimiter class."""
+
+    def test_failure_halves_limit(self) -> None:
+        """Test a rejected request halves the limit down to the minimum."""
+        limiter = AdaptiveLimiter(initial=8, minimum=1, maximum=10)
+
+        limiter.notify(False)
+        assert limiter.limit == 4
+
+        for _ in range(5):
+            limiter.notify(False)
+        assert limiter.limit == 1
+
+    def test_fast_successes_grow_limit(self) -> None:
+        """Test successful round trips at target latency raise the limit."""
+        limiter = AdaptiveLimiter(initial=2, minimum=1, maximum=3)
+
+        for _ in range(20):
+            limiter.notify(True, 0.1)
+
+        assert limiter.limit == 3
+
+    def test_slow_successes_do_not_grow_limit(self) -> None:
+        """Test round trips slower than the recent median don't raise the limit."""
+        limiter = AdaptiveLimiter(initial=2, minimum=1, maximum=10)
+        limiter.notify(True, 0.1)
+        before = limiter._limit
+
+        limiter.notify(True, 1.0)
+
+        assert limiter._limit == before
+
+    @pytest.mark.asyncio
+    async def test_limits_concurrency(self) -> None:
+        """Test no more than `limit` holders run at once."""
+        limiter = AdaptiveLimiter(initial=2, minimum=1, maximum=2)
+        active = 0
+        peak = 0
+
+        async def hold() -> None:
+            nonlocal active, peak
+            async with limiter:
+                active += 1
+                peak = max(peak, active)
+                await asyncio.sleep(0)
+                active -= 1
+
+        await asyncio.gather(*(hold() for _ in range(6)))
+
+        assert peak == 2
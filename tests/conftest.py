@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
+import json
 from datetime import datetime, timezone
+from functools import partial
 from typing import Any, Generator
 from unittest.mock import AsyncMock, MagicMock, patch
 
@@ -209,7 +211,13 @@ def mock_auth() -> Generator[AsyncMock, None, None]:
     auth.access_token = TEST_ACCESS_TOKEN
     auth.refresh_token = TEST_REFRESH_TOKEN
     auth.app_uuid = TEST_APP_UUID
+    auth.request_headers = {
+        "Authorization": f"Bearer {TEST_ACCESS_TOKEN}",
+        "app-uuid": TEST_APP_UUID,
+        "Content-Type": "application/json",
+    }
     auth.is_token_valid = True
+    auth.get_cached_valid_token = MagicMock(return_value=TEST_ACCESS_TOKEN)
     auth.ensure_valid_token = AsyncMock(return_value=TEST_ACCESS_TOKEN)
     auth.login = AsyncMock()
     auth.refresh = AsyncMock(return_value=TEST_ACCESS_TOKEN)
@@ -245,6 +253,8 @@ def mock_api_client(
     client.disable_silence_times = AsyncMock()
     client.get_tracking_mode = AsyncMock(return_value=None)
     client.update_device_settings = AsyncMock()
+    # Run the real bundle helper so it picks up the per-endpoint mocks above
+    client.fetch_device_bundle = partial(AnioApiClient.fetch_device_bundle, client)
     yield client
 
 
@@ -309,6 +319,10 @@ def create_mock_response(
     response = MagicMock()
     response.status = status
     response.json = AsyncMock(return_value=json_data)
+    response.read = AsyncMock(
+        return_value=b"" if json_data is None else json.dumps(json_data).encode()
+    )
     response.text = AsyncMock(return_value=text)
+    response.content.read = AsyncMock(return_value=text.encode())
     response.headers = {}
     return response
@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
 
 import pytest
 from homeassistant.components.binary_sensor import BinarySensorDeviceClass
@@ -80,6 +80,24 @@ class TestAnioOnlineSensor:
         )
         assert sensor.is_on is None
 
+    def test_device_state_refreshed_on_update(
+        self, hass: HomeAssistant, mock_device_state: AnioDeviceState
+    ) -> None:
+        """Test the cached device state is dropped on coordinator updates."""
+        coordinator = MagicMock()
+        coordinator.data = {TEST_DEVICE_ID: mock_device_state}
+        sensor = AnioOnlineSensor(
+            coordinator=coordinator,
+            device_id=TEST_DEVICE_ID,
+        )
+        assert sensor.is_on is True
+
+        coordinator.data = {}
+        with patch.object(sensor, "async_write_ha_state"):
+            sensor._handle_coordinator_update()
+
+        assert sensor.is_on is None
+
 
 class TestAnioGeofenceSensor:
     """Tests for AnioGeofenceSensor."""
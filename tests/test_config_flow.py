@@ -10,7 +10,13 @@ from homeassistant.const import CONF_EMAIL, CONF_PASSWORD
 from homeassistant.core import HomeAssistant
 from homeassistant.data_entry_flow import FlowResultType
 
-from custom_components.anio.api import AnioAuthError, AnioOtpRequiredError, AuthTokens
+from custom_components.anio.api import (
+    AnioAuthError,
+    AnioConnectionError,
+    AnioInvalidOtpError,
+    AnioOtpRequiredError,
+    AuthTokens,
+)
 from custom_components.anio.const import DOMAIN
 
 from .conftest import (
@@ -105,6 +111,30 @@ class TestConfigFlow:
         assert result["type"] == FlowResultType.FORM
         assert result["errors"]["base"] == "invalid_auth"
 
+    @pytest.mark.asyncio
+    async def test_flow_cannot_connect(self, hass: HomeAssistant) -> None:
+        """Test flow when the API can't be reached."""
+        with patch(
+            "custom_components.anio.config_flow.AnioAuth",
+        ) as mock_auth_class:
+            mock_auth = mock_auth_class.return_value
+            mock_auth.login = AsyncMock(side_effect=AnioConnectionError())
+
+            result = await hass.config_entries.flow.async_init(
+                DOMAIN, context={"source": config_entries.SOURCE_USER}
+            )
+
+            result = await hass.config_entries.flow.async_configure(
+                result["flow_id"],
+                {
+                    CONF_EMAIL: TEST_EMAIL,
+                    CONF_PASSWORD: TEST_PASSWORD,
+                },
+            )
+
+        assert result["type"] == FlowResultType.FORM
+        assert result["errors"]["base"] == "cannot_connect"
+
     @pytest.mark.asyncio
     async def test_flow_2fa_required(
         self, hass: HomeAssistant, mock_auth_success: AsyncMock
@@ -162,14 +192,14 @@ class TestConfigFlow:
         mock_auth_success.login = AsyncMock(
             side_effect=[
                 AnioOtpRequiredError(),
-                AnioAuthError("Invalid OTP"),
+                AnioInvalidOtpError(),
             ]
         )
 
         with patch(
             "custom_components.anio.config_flow.AnioAuth",
             return_value=mock_auth_success,
-        ):
+        ) as mock_auth_class:
             result = await hass.config_entries.flow.async_init(
                 DOMAIN, context={"source": config_entries.SOURCE_USER}
             )
@@ -191,6 +221,56 @@ class TestConfigFlow:
         assert result["type"] == FlowResultType.FORM
         assert result["step_id"] == "2fa"
         assert result["errors"]["base"] == "invalid_otp"
+        # The OTP retry reuses the auth handler from the credentials step
+        mock_auth_class.assert_called_once()
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        ("second_login", "expected_error"),
+        [
+            (AnioOtpRequiredError(), "invalid_otp"),
+            (AnioAuthError("Invalid email or password"), "invalid_auth"),
+        ],
+    )
+    async def test_flow_2fa_not_completed(
+        self,
+        hass: HomeAssistant,
+        mock_auth_success: AsyncMock,
+        second_login: Exception,
+        expected_error: str,
+    ) -> None:
+        """Test the 2FA step re-shows its form instead of creating a tokenless entry."""
+        mock_auth_success.login = AsyncMock(
+            side_effect=[AnioOtpRequiredError(), second_login]
+        )
+        mock_auth_success.access_token = None
+        mock_auth_success.refresh_token = None
+
+        with patch(
+            "custom_components.anio.config_flow.AnioAuth",
+            return_value=mock_auth_success,
+        ):
+            result = await hass.config_entries.flow.async_init(
+                DOMAIN, context={"source": config_entries.SOURCE_USER}
+            )
+
+            result = await hass.config_entries.flow.async_configure(
+                result["flow_id"],
+                {
+                    CONF_EMAIL: TEST_EMAIL,
+                    CONF_PASSWORD: TEST_PASSWORD,
+                },
+            )
+
+            result = await hass.config_entries.flow.async_configure(
+                result["flow_id"],
+                {"otp_code": ""},
+            )
+
+        assert result["type"] == FlowResultType.FORM
+        assert result["step_id"] == "2fa"
+        assert result["errors"]["base"] == expected_error
+        assert not hass.config_entries.async_entries(DOMAIN)
 
     @pytest.mark.asyncio
     async def test_flow_already_configured(
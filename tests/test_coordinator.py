@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import math
 from datetime import datetime, timedelta, timezone
 from unittest.mock import AsyncMock, MagicMock, patch
 
@@ -11,15 +12,59 @@ from homeassistant.exceptions import ConfigEntryAuthFailed
 from homeassistant.helpers.update_coordinator import UpdateFailed
 
 from custom_components.anio.api import (
+    AnioApiError,
     AnioAuthError,
     AnioConnectionError,
+    AnioDeviceState,
     AnioRateLimitError,
 )
-from custom_components.anio.coordinator import AnioDataUpdateCoordinator
+from custom_components.anio.api.models import Geofence
+from custom_components.anio.coordinator import (
+    EARTH_RADIUS,
+    AnioDataUpdateCoordinator,
+    _is_within_radius,
+)
 
 from .conftest import TEST_DEVICE_ID, TEST_DEVICE_NAME
 
 
+def _destination(
+    lat: float, lon: float, distance: float, bearing: float
+) -> tuple[float, float]:
+    """Get the point a great-circle distance away along a bearing, in degrees."""
+    lat1, lon1 = math.radians(lat), math.radians(lon)
+    angle, theta = distance / EARTH_RADIUS, math.radians(bearing)
+    lat2 = math.asin(
+        math.sin(lat1) * math.cos(angle)
+        + math.cos(lat1) * math.sin(angle) * math.cos(theta)
+    )
+    lon2 = lon1 + math.atan2(
+        math.sin(theta) * math.sin(angle) * math.cos(lat1),
+        math.cos(angle) - math.sin(lat1) * math.sin(lat2),
+    )
+    return math.degrees(lat2), math.degrees(lon2)
+
+
+def _within(
+    device_lat: float,
+    device_lon: float,
+    fence_lat: float,
+    fence_lon: float,
+    radius: float,
+) -> bool:
+    """Check a point against a fence, both given in degrees."""
+    lat, fence_lat_rad = math.radians(device_lat), math.radians(fence_lat)
+    return _is_within_radius(
+        lat,
+        math.radians(device_lon),
+        math.cos(lat),
+        fence_lat_rad,
+        math.radians(fence_lon),
+        math.cos(fence_lat_rad),
+        radius,
+    )
+
+
 class TestAnioDataUpdateCoordinator:
     """Tests for AnioDataUpdateCoordinator."""
 
@@ -53,6 +98,20 @@ class TestAnioDataUpdateCoordinator:
         mock_api_client.get_geofences.assert_called_once()
         mock_api_client.get_activity.assert_called_once()
 
+    @pytest.mark.asyncio
+    async def test_update_api_error(
+        self,
+        coordinator: AnioDataUpdateCoordinator,
+        mock_api_client: AsyncMock,
+    ) -> None:
+        """Test a failed per-device request raises UpdateFailed."""
+        mock_api_client.get_last_location.side_effect = AnioApiError(
+            "Internal server error", 500
+        )
+
+        with pytest.raises(UpdateFailed, match="API error"):
+            await coordinator._async_update_data()
+
     @pytest.mark.asyncio
     async def test_update_auth_error(
         self, coordinator: AnioDataUpdateCoordinator, mock_api_client: AsyncMock
@@ -96,13 +155,33 @@ class TestAnioDataUpdateCoordinator:
         assert len(coordinator.geofences) == 1
         assert coordinator.geofences[0].id == mock_geofence.id
 
+    @pytest.mark.asyncio
+    async def test_geofences_refetched_every_few_polls(
+        self,
+        coordinator: AnioDataUpdateCoordinator,
+        mock_api_client: AsyncMock,
+        mock_geofence: MagicMock,
+    ) -> None:
+        """Test geofences are reused between periodic refetches."""
+        from custom_components.anio.const import GEOFENCE_REFRESH_POLLS
+
+        for _ in range(GEOFENCE_REFRESH_POLLS):
+            await coordinator._async_update_data()
+
+        mock_api_client.get_geofences.assert_called_once()
+        assert coordinator.geofences[0].id == mock_geofence.id
+
+        await coordinator._async_update_data()
+
+        assert mock_api_client.get_geofences.call_count == 2
+
     @pytest.mark.asyncio
     async def test_online_status_calculation_online(
         self, coordinator: AnioDataUpdateCoordinator
     ) -> None:
         """Test online status when recently seen."""
-        last_seen = datetime.now(timezone.utc)
-        is_online = coordinator._calculate_online_status(last_seen)
+        now = datetime.now(timezone.utc)
+        is_online = coordinator._calculate_online_status(now, now)
         assert is_online is True
 
     @pytest.mark.asyncio
@@ -110,8 +189,9 @@ class TestAnioDataUpdateCoordinator:
         self, coordinator: AnioDataUpdateCoordinator
     ) -> None:
         """Test online status when not recently seen."""
-        last_seen = datetime.now(timezone.utc) - timedelta(minutes=15)
-        is_online = coordinator._calculate_online_status(last_seen)
+        now = datetime.now(timezone.utc)
+        last_seen = now - timedelta(minutes=15)
+        is_online = coordinator._calculate_online_status(last_seen, now)
         assert is_online is False
 
     @pytest.mark.asyncio
@@ -119,33 +199,54 @@ class TestAnioDataUpdateCoordinator:
         self, coordinator: AnioDataUpdateCoordinator
     ) -> None:
         """Test online status when never seen."""
-        is_online = coordinator._calculate_online_status(None)
+        is_online = coordinator._calculate_online_status(
+            None, datetime.now(timezone.utc)
+        )
         assert is_online is False
 
-    @pytest.mark.asyncio
-    async def test_is_inside_geofence(
-        self, coordinator: AnioDataUpdateCoordinator
-    ) -> None:
+    def test_is_within_radius(self) -> None:
         """Test geofence distance calculation."""
         # Point inside (same location)
-        is_inside = coordinator._is_inside_geofence(
-            device_lat=52.5200,
-            device_lon=13.4050,
-            fence_lat=52.5200,
-            fence_lon=13.4050,
-            radius_meters=100,
-        )
-        assert is_inside is True
+        assert _within(52.5200, 13.4050, 52.5200, 13.4050, 100) is True
 
         # Point outside (far away)
-        is_inside = coordinator._is_inside_geofence(
-            device_lat=52.5200,
-            device_lon=13.4050,
-            fence_lat=52.6000,  # Different location
-            fence_lon=13.5000,
-            radius_meters=100,
+        assert _within(52.5200, 13.4050, 52.6000, 13.5000, 100) is False
+
+    def test_is_within_radius_edge_cases(self) -> None:
+        """Test fences across the antimeridian and beyond the flat-earth range."""
+        # ~111 m apart on either side of the antimeridian
+        assert _within(0.0, 179.9995, 0.0, -179.9995, 200)
+
+        # ~11 km apart, checked with the haversine fallback
+        assert _within(52.5200, 13.4050, 52.6000, 13.5000, 12000)
+        assert not _within(52.5200, 13.4050, 52.6000, 13.5000, 10900)
+
+    @pytest.mark.parametrize("fence_lat", [45.0, 60.0, 70.0])
+    @pytest.mark.parametrize("bearing", [45.0, 135.0])
+    def test_is_within_radius_boundary(self, fence_lat: float, bearing: float) -> None:
+        """Test points just either side of a large fence edge away from the equator."""
+        for distance, expected in ((9998, True), (10002, False)):
+            device_lat, device_lon = _destination(fence_lat, 10.0, distance, bearing)
+            assert _within(device_lat, device_lon, fence_lat, 10.0, 10000) is expected
+
+    def test_compute_geofence_presence(
+        self,
+        coordinator: AnioDataUpdateCoordinator,
+        mock_device_state: AnioDeviceState,
+        mock_geofence: Geofence,
+    ) -> None:
+        """Test every device is checked against every geofence."""
+        far_away = Geofence(id="far", name="Far", lat=48.1, lng=11.6, radius=500)
+        coordinator._geofences = [mock_geofence, far_away]
+
+        presence = coordinator._compute_geofence_presence(
+            {TEST_DEVICE_ID: mock_device_state}
         )
-        assert is_inside is False
+
+        assert presence == {
+            (TEST_DEVICE_ID, mock_geofence.id): True,
+            (TEST_DEVICE_ID, "far"): False,
+        }
 
     @pytest.mark.asyncio
     async def test_is_device_in_geofence(
@@ -259,6 +360,32 @@ class TestAnioDataUpdateCoordinator:
         # Should only fire once
         assert len(events) == 1
 
+    @pytest.mark.asyncio
+    async def test_seen_messages_evict_oldest(
+        self,
+        coordinator: AnioDataUpdateCoordinator,
+    ) -> None:
+        """Test the seen-message window drops the oldest IDs first."""
+        from custom_components.anio.api.models import ActivityItem
+        from custom_components.anio.coordinator import MAX_SEEN_MESSAGES
+
+        activity = [
+            ActivityItem(
+                id=f"activity{i}",
+                deviceId=TEST_DEVICE_ID,
+                type="MESSAGE",
+                timestamp=datetime.now(timezone.utc),
+                data={"id": f"msg{i}", "sender": "APP"},
+            )
+            for i in range(MAX_SEEN_MESSAGES + 1)
+        ]
+
+        await coordinator._process_messages(activity)
+
+        assert len(coordinator._seen_messages) == MAX_SEEN_MESSAGES
+        assert "msg0" not in coordinator._seen_messages
+        assert f"msg{MAX_SEEN_MESSAGES}" in coordinator._seen_messages
+
     @pytest.mark.asyncio
     async def test_refresh_for_device(
         self,
@@ -271,3 +398,34 @@ class TestAnioDataUpdateCoordinator:
         ) as mock_refresh:
             await coordinator.async_request_refresh_for_device(TEST_DEVICE_ID)
             mock_refresh.assert_called_once()
+
+    def test_apply_device_settings(
+        self,
+        coordinator: AnioDataUpdateCoordinator,
+        mock_device_state: AnioDeviceState,
+    ) -> None:
+        """Test a confirmed settings change updates the cached state in place."""
+        coordinator.data = {TEST_DEVICE_ID: mock_device_state}
+
+        with patch.object(coordinator, "async_update_listeners") as mock_update:
+            coordinator.async_apply_device_settings(
+                TEST_DEVICE_ID, ring_profile="SILENT"
+            )
+
+        assert mock_device_state.device.settings.ring_profile == "SILENT"
+        mock_update.assert_called_once()
+
+    def test_apply_silence_times_enabled(
+        self,
+        coordinator: AnioDataUpdateCoordinator,
+        mock_device_state: AnioDeviceState,
+    ) -> None:
+        """Test a confirmed silence time toggle updates the cached state."""
+        coordinator.data = {TEST_DEVICE_ID: mock_device_state}
+
+        with patch.object(coordinator, "async_update_listeners") as mock_update:
+            coordinator.async_apply_silence_times_enabled(TEST_DEVICE_ID, False)
+
+        assert mock_device_state.silence_times
+        assert not any(st.enabled for st in mock_device_state.silence_times)
+        mock_update.assert_called_once()
@@ -2,16 +2,18 @@
 
 from __future__ import annotations
 
+from datetime import timedelta
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 from homeassistant.config_entries import ConfigEntryState
-from homeassistant.const import CONF_EMAIL
+from homeassistant.const import CONF_EMAIL, EVENT_HOMEASSISTANT_CLOSE
 from homeassistant.core import HomeAssistant
 
 from custom_components.anio import (
     async_setup_entry,
     async_unload_entry,
+    async_update_options,
 )
 from custom_components.anio.const import (
     CONF_ACCESS_TOKEN,
@@ -91,6 +93,92 @@ class TestIntegrationSetup:
                 mock_config_entry_loaded, PLATFORMS
             )
 
+    @pytest.mark.asyncio
+    async def test_session_closed_on_shutdown(
+        self,
+        hass: HomeAssistant,
+        mock_config_entry_loaded: MagicMock,
+        mock_auth: AsyncMock,
+        mock_api_client: AsyncMock,
+    ) -> None:
+        """Test the dedicated session is closed when Home Assistant stops."""
+        mock_session = MagicMock()
+        mock_session.close = AsyncMock()
+
+        with (
+            patch(
+                "custom_components.anio.create_session",
+                return_value=mock_session,
+            ),
+            patch(
+                "custom_components.anio.AnioAuth",
+                return_value=mock_auth,
+            ),
+            patch(
+                "custom_components.anio.AnioApiClient",
+                return_value=mock_api_client,
+            ),
+            patch(
+                "custom_components.anio.AnioDataUpdateCoordinator",
+            ) as mock_coordinator_class,
+            patch.object(
+                hass.config_entries,
+                "async_forward_entry_setups",
+                new_callable=AsyncMock,
+            ),
+        ):
+            mock_coordinator = MagicMock()
+            mock_coordinator.async_config_entry_first_refresh = AsyncMock()
+            mock_coordinator_class.return_value = mock_coordinator
+
+            await async_setup_entry(hass, mock_config_entry_loaded)
+
+        hass.bus.async_fire(EVENT_HOMEASSISTANT_CLOSE)
+        await hass.async_block_till_done()
+
+        mock_session.close.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_async_setup_entry_persists_app_uuid(
+        self,
+        hass: HomeAssistant,
+        mock_config_entry_loaded: MagicMock,
+        mock_auth: AsyncMock,
+        mock_api_client: AsyncMock,
+    ) -> None:
+        """Test a missing app UUID is generated once and stored on the entry."""
+        mock_config_entry_loaded.data = {
+            k: v
+            for k, v in mock_config_entry_loaded.data.items()
+            if k != CONF_APP_UUID
+        }
+
+        with (
+            patch(
+                "custom_components.anio.AnioAuth",
+                return_value=mock_auth,
+            ) as mock_auth_class,
+            patch(
+                "custom_components.anio.AnioApiClient",
+                return_value=mock_api_client,
+            ),
+            patch(
+                "custom_components.anio.AnioDataUpdateCoordinator",
+            ) as mock_coordinator_class,
+        ):
+            mock_coordinator = MagicMock()
+            mock_coordinator.async_config_entry_first_refresh = AsyncMock()
+            mock_coordinator_class.return_value = mock_coordinator
+
+            await async_setup_entry(hass, mock_config_entry_loaded)
+
+        hass.config_entries.async_update_entry.assert_called_once()
+        updated_data = hass.config_entries.async_update_entry.call_args.kwargs["data"]
+        assert updated_data[CONF_APP_UUID]
+        assert (
+            mock_auth_class.call_args.kwargs["app_uuid"] == updated_data[CONF_APP_UUID]
+        )
+
     @pytest.mark.asyncio
     async def test_async_setup_entry_auth_failure(
         self,
@@ -170,6 +258,7 @@ class TestIntegrationUnload:
                 "coordinator": coordinator,
                 "auth": MagicMock(),
                 "client": MagicMock(),
+                "session": AsyncMock(),
             }
         }
         return entry
@@ -187,14 +276,16 @@ class TestIntegrationUnload:
             new_callable=AsyncMock,
             return_value=True,
         ) as mock_unload:
+            entry_data = hass.data[DOMAIN][mock_config_entry_with_data.entry_id]
             result = await async_unload_entry(hass, mock_config_entry_with_data)
 
             assert result is True
             mock_unload.assert_called_once_with(
                 mock_config_entry_with_data, PLATFORMS
             )
-            # Data should be cleaned up
+            # Data should be cleaned up and the dedicated session closed
             assert mock_config_entry_with_data.entry_id not in hass.data[DOMAIN]
+            entry_data["session"].close.assert_awaited_once()
 
     @pytest.mark.asyncio
     async def test_async_unload_entry_platform_failure(
@@ -216,6 +307,54 @@ class TestIntegrationUnload:
             assert mock_config_entry_with_data.entry_id in hass.data[DOMAIN]
 
 
+class TestOptionsUpdate:
+    """Tests for options updates."""
+
+    @pytest.fixture
+    def mock_coordinator(
+        self, hass: HomeAssistant, mock_config_entry: MagicMock
+    ) -> MagicMock:
+        """Register a running coordinator for the config entry."""
+        coordinator = MagicMock()
+        coordinator.update_interval = timedelta(seconds=300)
+        hass.data[DOMAIN] = {
+            mock_config_entry.entry_id: {"coordinator": coordinator}
+        }
+        hass.config_entries.async_reload = AsyncMock()
+        return coordinator
+
+    @pytest.mark.asyncio
+    async def test_scan_interval_applied_in_place(
+        self,
+        hass: HomeAssistant,
+        mock_config_entry: MagicMock,
+        mock_coordinator: MagicMock,
+    ) -> None:
+        """Test a scan interval change updates the coordinator without reload."""
+        mock_config_entry.options = {"scan_interval": 120}
+
+        await async_update_options(hass, mock_config_entry)
+
+        assert mock_coordinator.update_interval == timedelta(seconds=120)
+        hass.config_entries.async_reload.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_unknown_option_reloads(
+        self,
+        hass: HomeAssistant,
+        mock_config_entry: MagicMock,
+        mock_coordinator: MagicMock,
+    ) -> None:
+        """Test other option changes still trigger a full reload."""
+        mock_config_entry.options = {"scan_interval": 120, "other": True}
+
+        await async_update_options(hass, mock_config_entry)
+
+        hass.config_entries.async_reload.assert_awaited_once_with(
+            mock_config_entry.entry_id
+        )
+
+
 class TestDomainData:
     """Tests for domain data structure."""
 
@@ -13,6 +13,7 @@ import base64
 import json
 import time
 from datetime import datetime, timedelta, timezone
+from functools import partial
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
@@ -88,10 +89,15 @@ class _MockResponse:
         self._json_data = json_data
         self._text = text
         self.headers: dict[str, str] = {}
+        self.content = MagicMock()
+        self.content.read = AsyncMock(return_value=text.encode())
 
-    async def json(self):
+    async def json(self, **kwargs):
         return self._json_data
 
+    async def read(self):
+        return b"" if self._json_data is None else json.dumps(self._json_data).encode()
+
     async def text(self):
         return self._text
 
@@ -244,8 +250,14 @@ class TestApiClient401:
         )
 
         auth_mock = AsyncMock(spec=AnioAuth)
+        auth_mock.get_cached_valid_token = MagicMock(return_value=None)
         auth_mock.ensure_valid_token = AsyncMock(return_value=TEST_ACCESS_TOKEN)
         auth_mock.app_uuid = TEST_APP_UUID
+        auth_mock.request_headers = {
+            "Authorization": f"Bearer {TEST_ACCESS_TOKEN}",
+            "app-uuid": TEST_APP_UUID,
+            "Content-Type": "application/json",
+        }
 
         client = AnioApiClient(session=session, auth=auth_mock)
 
@@ -372,6 +384,9 @@ class TestFullDataFlow:
         mock_client.get_alarms = AsyncMock(return_value=[])
         mock_client.get_silence_times = AsyncMock(return_value=[])
         mock_client.get_tracking_mode = AsyncMock(return_value=None)
+        mock_client.fetch_device_bundle = partial(
+            AnioApiClient.fetch_device_bundle, mock_client
+        )
 
         coordinator = AnioDataUpdateCoordinator(
             hass=hass,
@@ -412,6 +427,7 @@ class TestSetupWiresCallback:
 
         hass = MagicMock(spec=HomeAssistant)
         hass.data = {}
+        hass.bus = MagicMock()
         hass.config_entries = MagicMock()
         hass.config_entries.async_forward_entry_setups = AsyncMock()
 
@@ -439,8 +455,8 @@ class TestSetupWiresCallback:
 
         with (
             patch(
-                "custom_components.anio.async_get_clientsession",
-                return_value=MagicMock(),
+                "custom_components.anio.create_session",
+                return_value=AsyncMock(),
             ),
             patch(
                 "custom_components.anio.AnioAuth",
@@ -81,7 +81,10 @@ class TestAnioRingProfileSelect:
         ring_select._client.update_device_settings.assert_called_once_with(
             TEST_DEVICE_ID, ringProfile="SILENT"
         )
-        ring_select.coordinator.async_request_refresh.assert_called_once()
+        ring_select.coordinator.async_apply_device_settings.assert_called_once_with(
+            TEST_DEVICE_ID, ring_profile="SILENT"
+        )
+        ring_select.coordinator.async_request_refresh.assert_not_called()
 
     @pytest.mark.asyncio
     async def test_select_option_vibrate(
@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 from datetime import datetime
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
 
 import pytest
 from homeassistant.components.sensor import SensorDeviceClass, SensorStateClass
@@ -80,6 +80,31 @@ class TestAnioBatterySensor:
         )
         assert sensor.native_value is None
 
+    def test_native_value_follows_updates(
+        self, battery_sensor: AnioBatterySensor
+    ) -> None:
+        """Test the cached value is recomputed on coordinator updates."""
+        battery_sensor.coordinator.data = {}
+        assert battery_sensor.native_value == 85
+
+        with patch.object(battery_sensor, "async_write_ha_state"):
+            battery_sensor._handle_coordinator_update()
+
+        assert battery_sensor.native_value is None
+
+    def test_unchanged_update_skips_write(
+        self, battery_sensor: AnioBatterySensor
+    ) -> None:
+        """Test the state is only written when the value changes."""
+        with patch.object(battery_sensor, "async_write_ha_state") as mock_write:
+            battery_sensor._handle_coordinator_update()
+            battery_sensor._handle_coordinator_update()
+            assert mock_write.call_count == 1
+
+            battery_sensor.coordinator.data = {}
+            battery_sensor._handle_coordinator_update()
+            assert mock_write.call_count == 2
+
 
 class TestAnioLastSeenSensor:
     """Tests for AnioLastSeenSensor."""
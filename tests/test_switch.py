@@ -74,7 +74,9 @@ class TestAnioSilenceTimeSwitch:
         silence_switch._client.enable_silence_times.assert_called_once_with(
             TEST_DEVICE_ID
         )
-        silence_switch.coordinator.async_request_refresh.assert_called_once()
+        apply = silence_switch.coordinator.async_apply_silence_times_enabled
+        apply.assert_called_once_with(TEST_DEVICE_ID, True)
+        silence_switch.coordinator.async_request_refresh.assert_not_called()
 
     @pytest.mark.asyncio
     async def test_turn_off(self, silence_switch: AnioSilenceTimeSwitch) -> None:
@@ -83,7 +85,9 @@ class TestAnioSilenceTimeSwitch:
         silence_switch._client.disable_silence_times.assert_called_once_with(
             TEST_DEVICE_ID
         )
-        silence_switch.coordinator.async_request_refresh.assert_called_once()
+        apply = silence_switch.coordinator.async_apply_silence_times_enabled
+        apply.assert_called_once_with(TEST_DEVICE_ID, False)
+        silence_switch.coordinator.async_request_refresh.assert_not_called()
 
     def test_extra_state_attributes(
         self, silence_switch: AnioSilenceTimeSwitch